@@ -1,4 +1,5 @@
 from flask import Flask
+from jinja2 import FileSystemBytecodeCache
 import os
 import logging
 import secrets
@@ -6,7 +7,22 @@ from flask_socketio import SocketIO
 
 socketio = SocketIO(async_mode='threading')
 
+# HTMX 폴링 경로에서 자주 렌더링되는 부분 템플릿 (기동 시 미리 컴파일)
+HOT_TEMPLATES = (
+    'partials/sync_status.html',
+    'partials/sync_card.html',
+    'partials/sync_config_form.html',
+    'partials/server_status_badge.html',
+)
+
 def create_app():
+    # 로깅 기본 설정 (run.py처럼 호출 측이 이미 설정했다면 그대로 둔다)
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s - %(levelname)s - %(message)s",
+        )
+
     # Flask 앱 인스턴스 생성
     app = Flask(__name__)
 
@@ -71,6 +87,13 @@ def create_app():
     with app.app_context():
         db.ensure_schema_upgrades()
 
+    # 템플릿 컴파일 결과를 재사용한다. 바이트코드는 임시 디렉터리에 캐시되어
+    # 재기동 시에도 파싱/컴파일을 건너뛰며, 실행 중에는 템플릿 변경을 감시하지 않는다.
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+    for template_name in HOT_TEMPLATES:
+        app.jinja_env.get_template(template_name)
+
     # 블루프린트(라우트) 등록
     from . import routes
     app.register_blueprint(routes.main)
@@ -1,45 +1,197 @@
-import sqlite3
-import click
-from flask import current_app, g
-
-def get_db():
-    """
-    애플리케이션 컨텍스트 동안 데이터베이스 연결을 유지하고 반환합니다.
-    """
-    if 'db' not in g:
-        g.db = sqlite3.connect(
-            current_app.config['DATABASE'],
-            detect_types=sqlite3.PARSE_DECLTYPES
-        )
-        # Row 객체를 사용하여 컬럼 이름으로 접근 가능하게 설정
-        g.db.row_factory = sqlite3.Row
-
-    return g.db
-
-def close_db(e=None):
-    """
-    애플리케이션 컨텍스트가 종료될 때 데이터베이스 연결을 닫습니다.
-    """
-    db = g.pop('db', None)
-
-    if db is not None:
-        db.close()
-
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from queue import Empty, Full, Queue
+
+import click
+from flask import current_app, g
+
+# 요청 간에 재사용할 유휴 연결 수 (초과분은 반환 시 닫는다)
+DB_POOL_SIZE = 4
+DB_POOL_EXTENSION = 'filesync_db_pool'
+DB_WRITER_EXTENSION = 'filesync_db_writer'
+# 연결별 prepared statement 캐시 크기
+DB_STATEMENT_CACHE_SIZE = 256
+# 백그라운드 쓰기 스레드가 한 트랜잭션으로 묶는 최대 문장 수
+DB_WRITE_BATCH_SIZE = 50
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 내 쓰기를 미리 직렬화해 연결끼리 SQLITE_BUSY 대기에 들어가지 않게 하는 잠금
+_write_lock = threading.Lock()
+
+
+@contextmanager
+def write_transaction(db):
+    """쓰기 잠금을 잡은 채 블록을 실행하고 커밋한다 (예외 시 롤백).
+
+    요청 경로의 쓰기와 백그라운드 쓰기 스레드가 같은 잠금을 쓰므로 읽기는 WAL에서
+    자유롭게 진행되고, 쓰기끼리는 SQLite 파일 잠금에 닿기 전에 순서가 정해진다.
+    """
+    with _write_lock:
+        try:
+            yield db
+        except BaseException:
+            if db.in_transaction:
+                db.rollback()
+            raise
+        db.commit()
+
+
+class ConnectionPool:
+    """요청마다 파일을 열고 PRAGMA를 다시 설정하지 않도록 SQLite 연결을 재사용하는 풀."""
+
+    def __init__(self, database, size=DB_POOL_SIZE):
+        self.database = database
+        self._idle = Queue(maxsize=size)
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.database,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,
+            cached_statements=DB_STATEMENT_CACHE_SIZE,
+            # 암묵적 트랜잭션을 BEGIN IMMEDIATE로 열어, 쓰기 잠금을 첫 문장에서 바로 잡는다
+            # (읽기로 시작한 트랜잭션을 쓰기로 올리다 SQLITE_BUSY로 실패하지 않도록)
+            isolation_level='IMMEDIATE',
+        )
+        # Row 객체를 사용하여 컬럼 이름으로 접근 가능하게 설정
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=30000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')  # 연결당 약 20 MiB 페이지 캐시
+        return conn
+
+    def acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except Empty:
+            return self._connect()
+
+    def release(self, conn):
+        # 커밋되지 않은 변경은 다음 사용자에게 넘기지 않는다.
+        if conn.in_transaction:
+            conn.rollback()
+        try:
+            self._idle.put_nowait(conn)
+        except Full:
+            conn.close()
+
+
+class BackgroundWriter:
+    """급하지 않은 쓰기(is_active 토글 등)를 요청 경로 밖에서 모아 커밋하는 단일 쓰기 스레드.
+
+    큐에 쌓인 문장을 최대 DB_WRITE_BATCH_SIZE개씩 한 트랜잭션으로 실행하므로
+    요청은 fsync를 기다리지 않는다. 각 항목의 on_done은 커밋 후 쓰기 스레드에서 호출된다.
+    """
+
+    def __init__(self, database):
+        self.database = database
+        self._queue = Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def submit(self, sql, params=(), on_done=None):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="filesync-db-writer", daemon=True)
+                self._thread.start()
+        self._queue.put((sql, params, on_done))
+
+    def flush(self):
+        """지금까지 넣은 쓰기가 모두 커밋될 때까지 기다린다."""
+        self._queue.join()
+
+    def _run(self):
+        conn = sqlite3.connect(self.database, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=30000')
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < DB_WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            try:
+                with _write_lock:
+                    conn.execute('BEGIN IMMEDIATE')
+                    try:
+                        for sql, params, _ in batch:
+                            conn.execute(sql, params)
+                        conn.execute('COMMIT')
+                    except sqlite3.Error:
+                        if conn.in_transaction:
+                            conn.execute('ROLLBACK')
+                        raise
+            except sqlite3.Error:
+                logger.exception("Background DB write failed (%d statements)", len(batch))
+            for _, _, on_done in batch:
+                if on_done is not None:
+                    try:
+                        on_done()
+                    except Exception:
+                        logger.exception("Background DB write callback failed")
+            for _ in batch:
+                self._queue.task_done()
+
+
+def get_writer():
+    """현재 앱의 백그라운드 쓰기 스레드를 반환합니다 (없으면 생성)."""
+    writer = current_app.extensions.get(DB_WRITER_EXTENSION)
+    if writer is None:
+        writer = current_app.extensions.setdefault(
+            DB_WRITER_EXTENSION, BackgroundWriter(current_app.config['DATABASE'])
+        )
+    return writer
+
+
+def _get_pool():
+    pool = current_app.extensions.get(DB_POOL_EXTENSION)
+    if pool is None:
+        pool = current_app.extensions.setdefault(
+            DB_POOL_EXTENSION, ConnectionPool(current_app.config['DATABASE'])
+        )
+    return pool
+
+
+def get_db():
+    """
+    애플리케이션 컨텍스트 동안 데이터베이스 연결을 유지하고 반환합니다.
+    """
+    if 'db' not in g:
+        g.db = _get_pool().acquire()
+
+    return g.db
+
+def close_db(e=None):
+    """
+    애플리케이션 컨텍스트가 종료될 때 데이터베이스 연결을 풀에 돌려줍니다.
+    """
+    db = g.pop('db', None)
+
+    if db is not None:
+        _get_pool().release(db)
+
 def init_db():
     """
     schema.sql 파일을 읽어 데이터베이스를 초기화합니다.
     """
     db = get_db()
-
-    with current_app.open_resource('schema.sql') as f:
-        db.executescript(f.read().decode('utf8'))
-
-@click.command('init-db')
-def init_db_command():
-    """기존 데이터를 삭제하고 새 테이블을 생성합니다."""
-    init_db()
-    click.echo('Initialized the database.')
-
+
+    with current_app.open_resource('schema.sql') as f:
+        db.executescript(f.read().decode('utf8'))
+
+@click.command('init-db')
+def init_db_command():
+    """기존 데이터를 삭제하고 새 테이블을 생성합니다."""
+    init_db()
+    click.echo('Initialized the database.')
+
 def init_app(app):
     """
     Flask 앱에 DB 관련 정리 함수와 명령어를 등록합니다.
@@ -91,4 +243,4 @@ def ensure_schema_upgrades():
 
     if altered:
         db.commit()
-
+
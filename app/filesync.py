@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import argparse
+import errno
+import heapq
 import json
 import logging
 import os
@@ -8,11 +10,13 @@ import shutil
 import sys
 import threading
 import time
-from queue import Empty, Queue
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, wait
+from queue import Empty, Full, LifoQueue, Queue
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 from watchdog.observers.api import BaseObserver
@@ -21,10 +25,12 @@ from watchdog.observers.polling import PollingObserver
 from app.utils import (
     format_size,
     parse_patterns,
-    matches_patterns,
+    compile_patterns,
     build_history_key,
     history_file_path,
+    history_journal_path,
     load_sync_history,
+    append_sync_history,
     save_sync_history,
 )
 
@@ -33,9 +39,39 @@ DEFAULT_RETENTION = 60
 DEFAULT_RETENTION_MODE = "days"
 DEFAULT_SETTLE_SECONDS = 3
 DEFAULT_SCAN_INTERVAL_MINUTES = 60
-COPY_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_COPY_WORKERS = min(4, os.cpu_count() or 1)
+COPY_CHUNK_SIZE = 1024 * 1024
+# 커널 복사 1회 호출량 범위. 작게 시작해 처리량을 보며 키우고, 취소 응답성을 위해 상한을 둔다.
+KERNEL_COPY_STEP = 256 * 1024
+KERNEL_COPY_MAX_STEP = 16 * 1024 * 1024
+# 호출량 조절 시 처리량을 비교할 구간 크기 (커널 복사 호출 수)
+KERNEL_COPY_TUNE_CALLS = 4
+# 중간 진행률 보고 간격(초)과 중간 보고를 시작할 최소 파일 크기
+PROGRESS_MIN_INTERVAL_SECONDS = 0.5
+PROGRESS_MIN_FILE_SIZE = 4 * COPY_CHUNK_SIZE
+# read/write 경로에서 미리 읽어 둘 청크 수 (읽기와 쓰기 I/O를 겹치기 위함)
+READ_AHEAD_DEPTH = 4
+FICLONE = 0x40049409  # linux/fs.h: _IOW(0x94, 9, int)
+LOOP_INTERVAL_SECONDS = 1.0
+MIN_TICK_SECONDS = 0.1
+# 종료 시 진행 중인 복사가 중단 신호를 받고 끝나기를 기다리는 최대 시간(초)
+COPY_STOP_WAIT_SECONDS = 10.0
+# 상태 콜백 전달 후 다음 전달까지 모으는 시간. 갱신 중인 작업이 많을수록 늘려 emit 빈도를 제한한다.
+STATUS_FLUSH_MIN_SECONDS = 0.033
+STATUS_FLUSH_MAX_SECONDS = 1.0
+RETENTION_MIN_INTERVAL_SECONDS = 60
 HISTORY_DIR_NAME = ".history"
 HISTORY_FILE_NAME = "sync_history.json"
+# 저널 줄 수가 이 값과 (히스토리 항목 수 x 4) 중 큰 값을 넘으면 스냅샷으로 압축한다.
+HISTORY_COMPACT_MIN_LINES = 256
+# FAT 계열의 mtime 해상도(2초) 안에서 바뀐 디렉터리는 목록을 캐시하지 않는다.
+DIR_CACHE_RACY_NS = 2_000_000_000
+# 기존 백업과 (크기, mtime)을 비교할 때의 mtime 허용 오차. FAT/exFAT는 mtime을 2초 단위로 저장한다.
+BACKUP_MTIME_TOLERANCE_NS = 2_000_000_000
+# 변경 이벤트도 디렉터리 변화도 없을 때 주기적 전체 스캔을 연속으로 생략할 최대 횟수
+RESCAN_MAX_SKIPS = 5
+# 같은 부모에서 이 개수 이상을 한 번에 stat할 때는 scandir 한 번으로 묶는다 (Windows).
+BATCH_STAT_MIN_PER_DIR = 8
 
 
 class _CopyLane:
@@ -165,12 +201,60 @@ class SourceCopyCoordinator:
 _copy_coordinator = SourceCopyCoordinator()
 
 
+class _StatusNotifier:
+    """상태 콜백을 전용 데몬 스레드에서 호출하는 생산자-소비자 전달기.
+
+    복사/루프 스레드는 최신 상태 스냅샷을 맡겨 두기만 하고(소켓 emit 등 콜백 I/O를
+    기다리지 않음), 전달 스레드가 밀린 스냅샷을 작업별로 최신 하나만 남겨 호출한다.
+    한 번 전달한 뒤에는 갱신된 작업 수에 비례한 시간(상한 STATUS_FLUSH_MAX_SECONDS)
+    동안 쉬어, 그 사이의 갱신을 다음 전달에 합친다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._pending: Dict[int, tuple] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, key: int, callback, snapshot: Dict[str, str]) -> None:
+        with self._lock:
+            self._pending[key] = (callback, snapshot)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="filesync-status-notifier",
+                    daemon=True,
+                )
+                self._thread.start()
+        self._ready.set()
+
+    def _run(self) -> None:
+        while True:
+            self._ready.wait()
+            with self._lock:
+                self._ready.clear()
+                batch, self._pending = self._pending, {}
+            for callback, snapshot in batch.values():
+                try:
+                    callback(snapshot)
+                except Exception:
+                    logging.exception("Status callback failed.")
+            time.sleep(
+                min(STATUS_FLUSH_MAX_SECONDS, STATUS_FLUSH_MIN_SECONDS * max(1, len(batch) // 4))
+            )
+
+
+_status_notifier = _StatusNotifier()
+
+
 @dataclass
 class PendingFile:
     path: Path
     last_size: int
     last_mtime: float
     stable_since: float  # 안정화가 시작된 시간 (timestamp)
+    check_at: float = 0.0  # 다음 CHECK_STABLE 예정 시각 (안정화 힙의 유효 항목 판별용)
+    write_closed: bool = False  # 쓰기 종료 이벤트로 안정화 대기를 생략했는지 여부
 
 
 class CopyCancelled(Exception):
@@ -188,9 +272,18 @@ class _SyncEventHandler(FileSystemEventHandler):
     def on_modified(self, event):
         self._handle_event(event)
 
+    def on_closed(self, event):
+        # inotify IN_CLOSE_WRITE: 작성자가 파일을 닫았으므로 안정화 대기를 생략할 수 있다.
+        if event.is_directory:
+            return
+        self.manager.queue_file_event(Path(event.src_path), write_closed=True)
+
     def on_moved(self, event):
+        # IN_MOVED_TO: 임시 파일을 완성한 뒤 rename하는 작성자가 많으므로
+        # 이동된 파일은 이미 닫힌 것으로 보고 안정화 대기를 생략한다.
         target_path = getattr(event, "dest_path", None) or event.src_path
-        self._handle_event(event, override_path=target_path)
+        if not event.is_directory:
+            self.manager.queue_file_event(Path(target_path), write_closed=True)
         self.manager.queue_delete_event(Path(event.src_path))
 
     def on_deleted(self, event):
@@ -214,11 +307,15 @@ class SyncConfig:
         settle_seconds: int = DEFAULT_SETTLE_SECONDS,
         log_level: str = "INFO",
         scan_interval_minutes: int = DEFAULT_SCAN_INTERVAL_MINUTES,
+        copy_workers: int = DEFAULT_COPY_WORKERS,
+        preserve_metadata: bool = False,
+        exclude_dirs: str | list[str] | None = None,
     ):
         self.source = source.resolve()
         self.destination = destination.resolve()
         self.pattern = pattern
         self.patterns = parse_patterns(pattern)
+        self.pattern_matcher = compile_patterns(self.patterns)
         self.retention = max(0, int(retention))
         self.retention_mode = retention_mode if retention_mode in ("days", "count", "sync") else DEFAULT_RETENTION_MODE
         self.settle_seconds = settle_seconds
@@ -229,6 +326,16 @@ class SyncConfig:
             interval_value = DEFAULT_SCAN_INTERVAL_MINUTES
         self.scan_interval_minutes = max(0, interval_value)
         self.scan_interval_seconds = self.scan_interval_minutes * 60
+        try:
+            self.copy_workers = max(1, int(copy_workers))
+        except (TypeError, ValueError):
+            self.copy_workers = DEFAULT_COPY_WORKERS
+        self.preserve_metadata = bool(preserve_metadata)
+        if isinstance(exclude_dirs, str):
+            exclude_dirs = exclude_dirs.split(",")
+        self.exclude_dirs = [part.strip() for part in exclude_dirs or () if part and part.strip()]
+        # 제외할 디렉터리 이름 판별 함수 (없으면 None)
+        self.exclude_dir_matcher = compile_patterns(self.exclude_dirs) if self.exclude_dirs else None
 
 
 def parse_args() -> SyncConfig:
@@ -289,6 +396,23 @@ def parse_args() -> SyncConfig:
         default=DEFAULT_SCAN_INTERVAL_MINUTES,
         help="주기적 전체 스캔 주기(분). 0이면 비활성화됩니다.",
     )
+    parser.add_argument(
+        "--copy-workers",
+        type=int,
+        default=DEFAULT_COPY_WORKERS,
+        help="동시에 복사할 파일 수 (기본값: %(default)s).",
+    )
+    parser.add_argument(
+        "--preserve-metadata",
+        action="store_true",
+        help="수정 시각 외에 권한/플래그/확장 속성까지 복사합니다 (shutil.copystat).",
+    )
+    parser.add_argument(
+        "--exclude-dir",
+        action="append",
+        default=[],
+        help="순회하지 않을 디렉터리 이름 글롭 패턴. 여러 번 지정하거나 콤마로 구분 (예: .git,.snapshots 또는 \".*\").",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -315,6 +439,9 @@ def parse_args() -> SyncConfig:
         settle_seconds=args.settle_seconds,
         log_level=args.log_level,
         scan_interval_minutes=args.scan_interval_minutes,
+        copy_workers=args.copy_workers,
+        preserve_metadata=args.preserve_metadata,
+        exclude_dirs=",".join(args.exclude_dir),
     )
 
 
@@ -324,55 +451,249 @@ def validate_paths(source: Path, destination: Path) -> None:
     destination.mkdir(parents=True, exist_ok=True)
 
 
-def snapshot_matching_files(source: Path, patterns: list[str]) -> Dict[Path, float]:
-    matches: Dict[Path, float] = {}
+class DirCache:
+    """디렉터리별 scandir 목록을 mtime_ns 기준으로 재사용하는 캐시.
+
+    디렉터리 mtime은 항목 추가/삭제/이름 변경 시에만 바뀌므로 이름 목록만 캐시하고,
+    파일 크기·mtime 같은 stat 정보는 호출 측에서 필요할 때 새로 조회한다.
+    prune_dir(이름)이 참인 하위 디렉터리는 순회 시 내려가지 않는다 (--exclude-dir).
+    """
+
+    def __init__(self, prune_dir: Optional[Callable[[str], bool]] = None):
+        self._listings: Dict[str, tuple[int, tuple[str, ...], tuple[str, ...]]] = {}
+        self._prune_dir = prune_dir
+        self._misses = 0
+        # 마지막으로 끝까지 마친 순회에서 다시 읽은(바뀐) 디렉터리가 있었는지
+        self.last_walk_changed = True
+
+    def listdir(self, path: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """(파일 이름 목록, 하위 디렉터리 이름 목록)을 반환한다."""
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = self._listings.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+        self._misses += 1
+
+        files: list[str] = []
+        dirs: list[str] = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.name)
+                    elif entry.is_file():
+                        files.append(entry.name)
+                except OSError:
+                    continue
+        listing = (tuple(files), tuple(dirs))
+        if time.time_ns() - mtime_ns > DIR_CACHE_RACY_NS:
+            self._listings[path] = (mtime_ns, *listing)
+        else:
+            self._listings.pop(path, None)
+        return listing
+
+    def walk(self, root: str, skip_root_dirs: frozenset[str] = frozenset()):
+        """root 이하를 (dirpath, files, dirs) 형태로 순회한다.
+
+        root 바로 아래의 skip_root_dirs 디렉터리는 내려가지 않는다.
+        순회를 끝까지 마치면 더 이상 존재하지 않는 디렉터리의 캐시 항목을 정리한다.
+        """
+        visited: set[str] = set()
+        prune_dir = self._prune_dir
+        misses_before = self._misses
+        stack = [root]
+        while stack:
+            dirpath = stack.pop()
+            try:
+                files, dirs = self.listdir(dirpath)
+            except OSError:
+                self._listings.pop(dirpath, None)
+                continue
+            visited.add(dirpath)
+            yield dirpath, files, dirs
+            for name in reversed(dirs):
+                if dirpath is root and name in skip_root_dirs:
+                    continue
+                if prune_dir is not None and prune_dir(name):
+                    continue
+                stack.append(os.path.join(dirpath, name))
+
+        prefix = os.path.join(root, "")
+        stale = [
+            key for key in self._listings
+            if key not in visited and (key == root or key.startswith(prefix))
+        ]
+        for key in stale:
+            del self._listings[key]
+        self.last_walk_changed = bool(stale) or self._misses != misses_before
+
+    def walk_matching(
+        self,
+        root: str,
+        is_match,
+        skip_root_dirs: frozenset[str] = frozenset(),
+    ) -> list[tuple[str, int, float, int]]:
+        """이름이 일치하는 파일을 (경로, 크기, mtime, mtime_ns) 평면 튜플 목록으로 반환한다.
+
+        트리 순회의 핫 루프로, Path/DirEntry 객체를 만들지 않고 경로 문자열과
+        stat 결과만 다룬다. 전역/속성 조회는 지역 변수로 미리 묶어 둔다.
+        """
+        results: list[tuple[str, int, float, int]] = []
+        append = results.append
+        stat = os.stat
+        sep = os.sep
+        for dirpath, files, _ in self.walk(root, skip_root_dirs):
+            prefix = dirpath if dirpath.endswith(sep) else dirpath + sep
+            for name in files:
+                if not is_match(name):
+                    continue
+                file_path = prefix + name
+                try:
+                    st = stat(file_path)
+                except FileNotFoundError:
+                    continue
+                append((file_path, st.st_size, st.st_mtime, st.st_mtime_ns))
+        return results
+
+
+def snapshot_matching_files(
+    source: Path,
+    patterns: list[str],
+    dir_cache: Optional[DirCache] = None,
+) -> Dict[str, float]:
+    """패턴과 일치하는 소스 파일의 {경로 문자열: mtime} 스냅샷.
+
+    건너뛰는 항목에는 Path 객체를 만들지 않으며, 일치한 파일만 한 번 stat한다.
+    """
     if not source.exists():
-        return matches
-    for file_path in source.rglob("*"):
-        if not file_path.is_file():
-            continue
-        if not matches_patterns(file_path.name, patterns):
-            continue
-        matches[file_path] = file_path.stat().st_mtime
-    return matches
+        return {}
+    cache = dir_cache or DirCache()
+    entries = cache.walk_matching(os.fspath(source), compile_patterns(patterns))
+    return {file_path: mtime for file_path, _, mtime, _ in entries}
 
 
 def detect_new_files(
     source: Path,
     patterns: list[str],
-    known_files: Dict[Path, float],
+    known_files: Dict[str, int],
+    dir_cache: Optional[DirCache] = None,
 ) -> list[Path]:
-    current_snapshot = snapshot_matching_files(source, patterns)
+    """known_files({경로 문자열: mtime_ns})와 비교해 새로 생겼거나 바뀐 파일만 반환.
+
+    전체 스냅샷 dict를 새로 만들지 않고 한 번의 순회에서 known_files를 갱신하며,
+    사라진 파일은 순회가 끝난 뒤 제거한다.
+    """
     new_files: list[Path] = []
-    for file_path, mtime in current_snapshot.items():
-        if file_path not in known_files or mtime > known_files[file_path]:
-            new_files.append(file_path)
-    known_files.clear()
-    known_files.update(current_snapshot)
+    seen: set[str] = set()
+    if source.exists():
+        cache = dir_cache or DirCache()
+        is_match = compile_patterns(patterns)
+        for dirpath, files, _ in cache.walk(os.fspath(source)):
+            for name in files:
+                if not is_match(name):
+                    continue
+                file_path = os.path.join(dirpath, name)
+                try:
+                    mtime_ns = os.stat(file_path).st_mtime_ns
+                except FileNotFoundError:
+                    continue
+                seen.add(file_path)
+                if known_files.get(file_path, -1) != mtime_ns:
+                    known_files[file_path] = mtime_ns
+                    new_files.append(Path(file_path))
+    if len(seen) != len(known_files):
+        for file_path in [key for key in known_files if key not in seen]:
+            del known_files[file_path]
     return new_files
 
 
 def wait_for_settle(file_path: Path, settle_seconds: int) -> bool:
+    """파일 크기/mtime이 settle_seconds 동안 변하지 않을 때까지 기다린다.
+
+    매 초 stat하는 대신 안정화가 끝날 수 있는 가장 이른 시각까지 잠든 뒤 한 번 확인하므로,
+    변경이 없으면 stat은 처음과 마지막 두 번뿐이다.
+    """
     if settle_seconds <= 0:
         return True
     try:
         stat = file_path.stat()
     except FileNotFoundError:
         return False
-    signature = (stat.st_size, stat.st_mtime)
-    stable_start = time.time()
+    signature = (stat.st_size, stat.st_mtime_ns)
+    stable_start = time.monotonic()
     while True:
-        time.sleep(1)
+        remaining = stable_start + settle_seconds - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
         try:
             stat = file_path.stat()
         except FileNotFoundError:
             return False
-        current_signature = (stat.st_size, stat.st_mtime)
-        if current_signature != signature:
-            signature = current_signature
-            stable_start = time.time()
-        if time.time() - stable_start >= settle_seconds:
+        current_signature = (stat.st_size, stat.st_mtime_ns)
+        if current_signature == signature:
             return True
+        signature = current_signature
+        stable_start = time.monotonic()
+
+
+def _mtime_to_ns(mtime: float) -> int:
+    """float mtime(초)을 ns 정수로 변환 (BACKUP_MTIME_TOLERANCE_NS 비교용 근사값)."""
+    return round(mtime * 1_000_000_000)
+
+
+def _is_same_backup(existing: Optional[tuple[int, int]], size: int, mtime_ns: int) -> bool:
+    """기존 백업(크기, mtime_ns)이 원본과 크기가 같고 mtime이 허용 오차 안이면 참."""
+    return (
+        existing is not None
+        and existing[0] == size
+        and abs(existing[1] - mtime_ns) <= BACKUP_MTIME_TOLERANCE_NS
+    )
+
+
+def _stat_many(paths: list[Path]) -> Dict[Path, os.stat_result | OSError]:
+    """여러 파일의 stat 결과를 {경로: stat_result 또는 OSError}로 반환한다.
+
+    Windows에서는 scandir가 디렉터리 열람 결과에 크기/mtime을 담아 주므로, 같은 부모에
+    파일이 여러 개면 부모당 scandir 한 번으로 처리한다. POSIX의 DirEntry.stat()은
+    파일마다 stat을 따로 호출하므로 개별 stat을 그대로 쓴다.
+    scandir에서 찾지 못한 이름은 개별 stat으로 다시 확인한다.
+    """
+    results: Dict[Path, os.stat_result | OSError] = {}
+    if os.name == "nt" and len(paths) >= BATCH_STAT_MIN_PER_DIR:
+        by_parent: Dict[Path, Dict[str, Path]] = {}
+        for path in paths:
+            by_parent.setdefault(path.parent, {})[path.name] = path
+        for parent, names in by_parent.items():
+            if len(names) < BATCH_STAT_MIN_PER_DIR:
+                continue
+            try:
+                with os.scandir(parent) as entries:
+                    for entry in entries:
+                        path = names.get(entry.name)
+                        if path is None:
+                            continue
+                        try:
+                            results[path] = entry.stat()
+                        except OSError as exc:
+                            results[path] = exc
+            except OSError:
+                continue
+    for path in paths:
+        if path not in results:
+            try:
+                results[path] = path.stat()
+            except OSError as exc:
+                results[path] = exc
+    return results
+
+
+def _fast_relpath(file_path: Path, root_parts: tuple[str, ...]) -> Optional[str]:
+    """root_parts 하위 경로면 posix 상대 경로 문자열을, 아니면 None을 반환 (예외 없음)."""
+    parts = file_path.parts
+    root_len = len(root_parts)
+    if len(parts) <= root_len or parts[:root_len] != root_parts:
+        return None
+    return "/".join(parts[root_len:])
 
 
 def build_destination_path(
@@ -380,14 +701,23 @@ def build_destination_path(
     source_file: Path,
     source_root: Path,
     overwrite_existing: bool = False,
+    rel_path: Optional[str] = None,
+    created_dirs: Optional[set[str]] = None,
 ) -> Path:
-    try:
-        rel_path = source_file.relative_to(source_root)
-    except ValueError:
-        rel_path = Path(source_file.name)
+    """대상 경로를 만든다.
+
+    rel_path(posix 상대 경로)를 넘기면 relative_to 계산을 생략하고, created_dirs에
+    이미 있는 상위 디렉터리는 mkdir을 다시 호출하지 않는다.
+    """
+    if rel_path is None:
+        rel_path = _fast_relpath(source_file, source_root.parts) or source_file.name
 
     target_path = destination / rel_path
-    target_path.parent.mkdir(parents=True, exist_ok=True)
+    parent_key = os.fspath(target_path.parent)
+    if created_dirs is None or parent_key not in created_dirs:
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        if created_dirs is not None:
+            created_dirs.add(parent_key)
 
     if target_path.exists():
         if overwrite_existing:
@@ -400,6 +730,206 @@ def build_destination_path(
     return target_path
 
 
+# 커널 복사 경로를 포기하고 다음 방식으로 넘어갈 errno 목록
+_KERNEL_COPY_FALLBACK_ERRNOS = frozenset(
+    code
+    for code in (
+        getattr(errno, "EXDEV", None),
+        getattr(errno, "EINVAL", None),
+        getattr(errno, "ENOSYS", None),
+        getattr(errno, "EOPNOTSUPP", None),
+        getattr(errno, "ENOTSUP", None),
+        getattr(errno, "EBADF", None),
+        getattr(errno, "EPERM", None),
+    )
+    if code is not None
+)
+
+
+def _kernel_copy_methods() -> list[str]:
+    """사용 가능한 커널 내 복사 방식 (우선순위 순)."""
+    if not sys.platform.startswith("linux"):
+        return []
+    methods = []
+    if hasattr(os, "copy_file_range"):
+        methods.append("copy_file_range")
+    if hasattr(os, "sendfile"):
+        methods.append("sendfile")
+    return methods
+
+
+def _kernel_copy_step(method: str, src_fd: int, dst_fd: int, count: int) -> int:
+    if method == "copy_file_range":
+        return os.copy_file_range(src_fd, dst_fd, count)
+    return os.sendfile(dst_fd, src_fd, None, count)
+
+
+class _KernelCopyTuner:
+    """커널 복사 1회 호출량을 측정 처리량에 맞춰 조절한다.
+
+    KERNEL_COPY_TUNE_CALLS번 호출마다 직전 구간과 처리량을 비교해 오르고 있으면 두 배,
+    떨어지면 절반으로 바꾼다. 작은 파일은 첫 호출(KERNEL_COPY_STEP) 한 번에 끝난다.
+    """
+
+    __slots__ = ("step", "_max_step", "_calls", "_window_bytes", "_window_start", "_last_rate")
+
+    def __init__(self, total: int):
+        self.step = KERNEL_COPY_STEP
+        self._max_step = max(KERNEL_COPY_STEP, min(total, KERNEL_COPY_MAX_STEP))
+        self._calls = 0
+        self._window_bytes = 0
+        self._window_start = time.monotonic()
+        self._last_rate = 0.0
+
+    def record(self, copied: int) -> None:
+        self._calls += 1
+        self._window_bytes += copied
+        if self._calls < KERNEL_COPY_TUNE_CALLS:
+            return
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        rate = self._window_bytes / elapsed if elapsed > 0 else float("inf")
+        if rate >= self._last_rate:
+            self.step = min(self.step * 2, self._max_step)
+        else:
+            self.step = max(self.step // 2, KERNEL_COPY_STEP)
+        self._last_rate = rate
+        self._calls = 0
+        self._window_bytes = 0
+        self._window_start = now
+
+
+def _userspace_copy_step(src, dst, buffer: memoryview) -> int:
+    """재사용 버퍼로 readinto → write 한 번. 청크마다 bytes 객체를 만들지 않는다."""
+    read = src.readinto(buffer)
+    if not read:
+        return 0
+    view = buffer[:read]
+    while view:
+        written = dst.write(view)
+        view = view[written:]
+    return read
+
+
+def _fadvise(fd: int, advice_name: str) -> None:
+    """posix_fadvise 힌트 (지원되지 않는 플랫폼/파일시스템에서는 무시)."""
+    advise = getattr(os, "posix_fadvise", None)
+    advice = getattr(os, advice_name, None)
+    if advise is None or advice is None:
+        return
+    try:
+        advise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+# read/write 경로용 청크 버퍼 풀. 파일마다 새로 할당하지 않고 작업/파일 간에 돌려 쓴다.
+# LIFO라 최근에 쓴 (캐시에 남아 있을 가능성이 큰) 버퍼가 먼저 나간다.
+_COPY_BUFFER_POOL: LifoQueue = LifoQueue(maxsize=DEFAULT_COPY_WORKERS * READ_AHEAD_DEPTH)
+
+
+def _borrow_copy_buffer() -> memoryview:
+    try:
+        return _COPY_BUFFER_POOL.get_nowait()
+    except Empty:
+        return memoryview(bytearray(COPY_CHUNK_SIZE))
+
+
+def _return_copy_buffer(buffer: memoryview) -> None:
+    try:
+        _COPY_BUFFER_POOL.put_nowait(buffer)
+    except Full:
+        pass  # 풀이 가득 차면 버린다 (메모리 상한 유지)
+
+
+def _pipelined_userspace_copy(src, dst, on_chunk) -> None:
+    """읽기 스레드가 다음 청크들을 미리 읽는 동안 현재 청크를 쓴다.
+
+    커널 복사를 쓸 수 없는 환경(Windows 등)에서 read와 write를 겹쳐, 원본과 대상이
+    서로 다른 디스크일 때 두 장치를 동시에 바쁘게 유지한다. 버퍼는 READ_AHEAD_DEPTH개를
+    공용 풀에서 빌려 돌려 쓰며, on_chunk(n)은 청크 쓰기가 끝날 때마다 호출된다
+    (예외를 던지면 읽기 스레드를 정리하고 그대로 전파한다).
+    """
+    free_buffers: Queue = Queue()
+    filled: Queue = Queue()
+    buffers = [_borrow_copy_buffer() for _ in range(READ_AHEAD_DEPTH)]
+    for buffer in buffers:
+        free_buffers.put(buffer)
+    stop = threading.Event()
+
+    def reader() -> None:
+        try:
+            while not stop.is_set():
+                buffer = free_buffers.get()
+                if buffer is None:
+                    return
+                read = src.readinto(buffer)
+                filled.put((buffer, read))
+                if not read:
+                    return
+        except BaseException as exc:
+            filled.put((None, exc))
+
+    thread = threading.Thread(target=reader, name="filesync-read-ahead", daemon=True)
+    thread.start()
+    try:
+        while True:
+            buffer, read = filled.get()
+            if buffer is None:
+                raise read
+            if not read:
+                break
+            view = buffer[:read]
+            while view:
+                view = view[dst.write(view):]
+            free_buffers.put(buffer)
+            on_chunk(read)
+    finally:
+        stop.set()
+        free_buffers.put(None)
+        thread.join()
+        for buffer in buffers:
+            _return_copy_buffer(buffer)
+
+
+class ProgressReporter:
+    """복사 한 건의 진행률 보고 상태를 담는 객체.
+
+    스로틀링 상태를 호출마다 새로 두므로 복사 풀의 워커끼리 공유하는 상태가 없다.
+    """
+
+    __slots__ = ("name", "total", "_callback", "_report_steps", "_next_report_at", "_step_bytes", "_next_bytes")
+
+    def __init__(self, name: str, total: int, callback=None):
+        self.name = name
+        self.total = total
+        self._callback = callback
+        # 몇 청크 안에 끝나는 작은 파일은 시작/완료만 보고한다.
+        self._report_steps = callback is not None and total >= PROGRESS_MIN_FILE_SIZE
+        self._next_report_at = 0.0
+        # 1% 단위로만 보고 (정수 비교라 청크마다 비용이 거의 없다)
+        self._step_bytes = max(1, total // 100)
+        self._next_bytes = 0
+
+    def start(self, copied: int) -> None:
+        if self._callback:
+            self._callback(self.name, copied, self.total)
+
+    def update(self, copied: int) -> None:
+        """중간 진행률. 1% 이상 진행했고 보고 간격이 지났을 때만 콜백을 호출한다."""
+        if not self._report_steps or copied < self._next_bytes:
+            return
+        now = time.monotonic()
+        if now >= self._next_report_at:
+            self._next_report_at = now + PROGRESS_MIN_INTERVAL_SECONDS
+            self._next_bytes = copied + self._step_bytes
+            self._callback(self.name, copied, self.total)
+
+    def finalize(self) -> None:
+        if self._callback:
+            self._callback(self.name, self.total, self.total)
+
+
 def copy_file_with_progress(
     source_file: Path,
     destination_path: Path,
@@ -407,38 +937,142 @@ def copy_file_with_progress(
     cancel_event: Optional[threading.Event] = None,
     mode: str = "wb",
     start_pos: int = 0,
+    total_size: Optional[int] = None,
 ) -> None:
-    total_size = source_file.stat().st_size
+    """source_file을 destination_path로 복사하며 진행률을 보고한다.
+
+    Linux에서는 copy_file_range → sendfile 순으로 커널 내 복사를 시도하고,
+    지원되지 않는 파일시스템/모드(EXDEV, EINVAL, O_APPEND 등)면 read/write로 전환한다.
+    호출 측이 이미 stat한 크기를 total_size로 넘기면 다시 stat하지 않는다.
+    """
+    if total_size is None:
+        total_size = source_file.stat().st_size
     copied = start_pos
+    reporter = ProgressReporter(source_file.name, total_size, progress_callback)
 
     def should_cancel() -> bool:
         return cancel_event is not None and cancel_event.is_set()
 
-    if progress_callback:
-        progress_callback(source_file.name, copied, total_size)
-    try:
-        with source_file.open("rb") as src, destination_path.open(mode) as dst:
-            if start_pos > 0:
-                src.seek(start_pos)
-            while True:
-                if should_cancel():
-                    raise CopyCancelled(f"Copy cancelled: {source_file}")
-                chunk = src.read(COPY_CHUNK_SIZE)
-                if not chunk:
-                    break
-                dst.write(chunk)
-                copied += len(chunk)
-                if should_cancel():
-                    raise CopyCancelled(f"Copy cancelled: {source_file}")
-                if progress_callback:
-                    progress_callback(source_file.name, copied, total_size)
-    except CopyCancelled:
-        raise
-    except Exception:
-        raise
+    def advance(step: int) -> None:
+        nonlocal copied
+        copied += step
+        if should_cancel():
+            raise CopyCancelled(f"Copy cancelled: {source_file}")
+        reporter.update(copied)
+
+    reporter.start(copied)
+
+    # O_APPEND fd는 커널 복사가 거부하므로, 이어받기는 r+b로 열고 끝으로 이동한다.
+    append = mode == "ab" and destination_path.exists()
+    open_mode = "r+b" if append else mode
+
+    # 커널 복사와 read/write가 같은 fd 위치를 공유하도록 버퍼 없이 연다.
+    with source_file.open("rb", buffering=0) as src, destination_path.open(open_mode, buffering=0) as dst:
+        if append:
+            dst.seek(0, os.SEEK_END)
+        if start_pos > 0:
+            src.seek(start_pos)
+        src_fd = src.fileno()
+        dst_fd = dst.fileno()
+        _fadvise(src_fd, "POSIX_FADV_SEQUENTIAL")
+        methods = _kernel_copy_methods()
+        reached_eof = False
+        tuner = _KernelCopyTuner(total_size - start_pos)
+
+        # 1단계: 커널 내 복사 (copy_file_range → sendfile)
+        while methods:
+            if should_cancel():
+                raise CopyCancelled(f"Copy cancelled: {source_file}")
+            try:
+                step = _kernel_copy_step(methods[0], src_fd, dst_fd, tuner.step)
+            except OSError as exc:
+                if exc.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+                    raise
+                logging.debug("%s unavailable (%s), falling back.", methods[0], exc)
+                methods.pop(0)
+                continue
+            if step == 0:
+                if copied < total_size:
+                    # 일부 파일시스템은 미지원 시 0을 반환하므로 EOF 판정은 read에 맡긴다.
+                    methods.pop(0)
+                    continue
+                reached_eof = True
+                break
+            tuner.record(step)
+            advance(step)
+
+        # 2단계: read/write. 남은 양이 많으면 미리 읽기 스레드로 읽기와 쓰기를 겹친다.
+        if not reached_eof:
+            if should_cancel():
+                raise CopyCancelled(f"Copy cancelled: {source_file}")
+            if total_size - copied > 2 * COPY_CHUNK_SIZE:
+                _pipelined_userspace_copy(src, dst, advance)
+            else:
+                buffer = _borrow_copy_buffer()
+                try:
+                    while True:
+                        step = _userspace_copy_step(src, dst, buffer)
+                        if not step:
+                            break
+                        advance(step)
+                finally:
+                    _return_copy_buffer(buffer)
+
+        # 백업은 한 번 읽고 끝나므로 페이지 캐시에 남기지 않는다. 큰 파일은 더티 페이지를
+        # 한 번에 내려쓴 뒤(DONTNEED는 더티 페이지를 버리지 않음) 캐시에서 해제한다.
+        if total_size >= PROGRESS_MIN_FILE_SIZE:
+            os.fsync(dst_fd)
+            _fadvise(dst_fd, "POSIX_FADV_DONTNEED")
+        _fadvise(src_fd, "POSIX_FADV_DONTNEED")
+
+    reporter.finalize()
+
+
+# FICLONE이 이 errno로 실패하면 같은 (소스 장치, 대상 장치) 조합에서는 다시 시도하지 않는다.
+_REFLINK_UNSUPPORTED_ERRNOS = frozenset(
+    code
+    for code in (
+        getattr(errno, "EOPNOTSUPP", None),
+        getattr(errno, "ENOTSUP", None),
+        getattr(errno, "EXDEV", None),
+        getattr(errno, "EINVAL", None),
+        getattr(errno, "ENOTTY", None),
+    )
+    if code is not None
+)
+# reflink를 지원하지 않는 것으로 확인된 (소스 st_dev, 대상 st_dev)
+_reflink_unsupported_devs: set[tuple[int, int]] = set()
+
+
+def _try_reflink(source_file: Path, destination_path: Path, source_dev: Optional[int] = None) -> bool:
+    """CoW 파일시스템(btrfs, XFS reflink 등)에서 FICLONE으로 데이터 복사 없이 복제.
 
-    if progress_callback:
-        progress_callback(source_file.name, total_size, total_size)
+    지원되지 않는 환경(다른 파일시스템, ext4 등)이면 False를 반환하고 호출 측이 일반 복사로 진행한다.
+    미지원으로 확인된 장치 조합은 기억해 두어, 이후 복사에서는 .part를 열어 보지 않고 건너뛴다.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    devs = None
+    if source_dev is not None:
+        try:
+            devs = (source_dev, os.stat(destination_path.parent).st_dev)
+        except OSError:
+            devs = None
+        if devs in _reflink_unsupported_devs:
+            return False
+    try:
+        with source_file.open("rb") as src, destination_path.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError as exc:
+        logging.debug("Reflink unavailable for %s: %s", source_file, exc)
+        if devs is not None and exc.errno in _REFLINK_UNSUPPORTED_ERRNOS:
+            _reflink_unsupported_devs.add(devs)
+        return False
+    return True
 
 
 def copy_backup(
@@ -448,26 +1082,44 @@ def copy_backup(
     overwrite_existing: bool = False,
     progress_callback=None,
     cancel_event: Optional[threading.Event] = None,
+    allow_reflink: bool = True,
+    rel_path: Optional[str] = None,
+    created_dirs: Optional[set[str]] = None,
+    preserve_metadata: bool = False,
+    source_stat: Optional[os.stat_result] = None,
 ) -> Optional[Path]:
+    """source_file을 .part 임시 파일로 복사한 뒤 대상 경로로 원자적으로 교체한다.
+
+    기본적으로 수정 시각만 원본과 같게 맞추며(os.utime, ns 단위), preserve_metadata가
+    참이면 권한/플래그/확장 속성까지 shutil.copystat으로 복사한다.
+    호출 측이 source_stat을 넘기면 그 크기/시각을 기준으로 복사한다 (다시 stat하지 않음).
+    """
     destination_path = build_destination_path(
         destination,
         source_file,
         source_root,
         overwrite_existing=overwrite_existing,
+        rel_path=rel_path,
+        created_dirs=created_dirs,
     )
 
     temp_path = destination_path.with_suffix(destination_path.suffix + ".part")
 
     copy_completed = False
     try:
-        total_size = source_file.stat().st_size
+        if source_stat is None:
+            source_stat = source_file.stat()
+        total_size = source_stat.st_size
 
         resume_mode = False
         start_pos = 0
         mode = "wb"
 
-        if temp_path.exists():
-            temp_size = temp_path.stat().st_size
+        try:
+            temp_size = os.stat(temp_path).st_size
+        except FileNotFoundError:
+            temp_size = None
+        if temp_size is not None:
             if temp_size < total_size:
                 logging.info("Resuming incomplete transfer: %s", temp_path.name)
                 resume_mode = True
@@ -483,30 +1135,33 @@ def copy_backup(
             resume_mode,
         )
 
-        destination_path.parent.mkdir(parents=True, exist_ok=True)
-
-        copy_file_with_progress(
-            source_file,
-            temp_path,
-            progress_callback=progress_callback,
-            cancel_event=cancel_event,
-            mode=mode,
-            start_pos=start_pos,
-        )
+        # 이어받기 중인 .part가 있으면 reflink로 덮어쓰지 않는다.
+        if allow_reflink and not resume_mode and _try_reflink(source_file, temp_path, source_stat.st_dev):
+            logging.info("Reflinked %s (no data copied)", source_file.name)
+            if progress_callback:
+                progress_callback(source_file.name, total_size, total_size)
+        else:
+            copy_file_with_progress(
+                source_file,
+                temp_path,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event,
+                mode=mode,
+                start_pos=start_pos,
+                total_size=total_size,
+            )
 
-        if destination_path.exists():
-            try:
-                if overwrite_existing:
-                    destination_path.unlink()
-                else:
-                    logging.warning("Target exists and overwrite is False. Skipping replacement.")
-                    return None
-            except OSError:
-                pass
+        # os.replace는 기존 대상을 원자적으로 덮어쓰므로 overwrite 시 별도 unlink가 필요 없다.
+        if not overwrite_existing and destination_path.exists():
+            logging.warning("Target exists and overwrite is False. Skipping replacement.")
+            return None
 
         os.replace(temp_path, destination_path)
 
-        shutil.copystat(source_file, destination_path, follow_symlinks=True)
+        if preserve_metadata:
+            shutil.copystat(source_file, destination_path, follow_symlinks=True)
+        else:
+            os.utime(destination_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
 
         logging.info("Sync completed: %s", destination_path.name)
         copy_completed = True
@@ -517,6 +1172,9 @@ def copy_backup(
         raise
     except Exception:
         logging.exception("Failed to copy %s", source_file)
+        if created_dirs is not None:
+            # 대상 폴더가 외부에서 지워졌을 수 있으므로 다음 시도에서 다시 만든다.
+            created_dirs.discard(os.fspath(destination_path.parent))
 
     return None
 
@@ -527,7 +1185,10 @@ def enforce_retention(
     patterns: list[str],
     sync_history: Dict[str, str],
     retention_mode: str = DEFAULT_RETENTION_MODE,
+    dir_cache: Optional[DirCache] = None,
+    history_epochs: Optional[Dict[str, float]] = None,
 ) -> bool:
+    """보존 정책 적용. history_epochs를 넘기면 히스토리 시각 문자열을 다시 파싱하지 않는다."""
     if retention_mode == "sync":
         return False
     if retention_mode == "count":
@@ -536,75 +1197,138 @@ def enforce_retention(
             patterns,
             sync_history,
             retention,
+            dir_cache,
+            history_epochs,
         )
-    return _enforce_days_retention(destination, patterns, sync_history, retention)
+    return _enforce_days_retention(
+        destination,
+        patterns,
+        sync_history,
+        retention,
+        dir_cache,
+        history_epochs,
+    )
 
 
-def _iter_backup_entries(destination: Path, patterns: list[str]):
-    """보존 대상이 될 파일/디렉터리 목록을 생성한다.
+def _iter_backup_entries(
+    destination: Path,
+    patterns: list[str],
+    dir_cache: Optional[DirCache] = None,
+):
+    """보존 대상이 될 (경로 문자열, 히스토리 키, 디렉터리 여부) 목록을 생성한다.
 
+    디렉터리 여부는 scandir 결과에서 그대로 전달하여 호출 측의 추가 stat을 없앤다.
+    히스토리 키는 디렉터리 단위 접두사에 이름만 붙여 만들므로 항목마다 Path 객체나
+    상대 경로 계산이 필요 없다.
     기존 로직은 파일만 대상으로 삼았기 때문에 .pbd 확장자를 가진 폴더형 백업이
     카운트 기준 보존에서 제외되는 문제가 있었다.
     """
     if not destination.exists():
         return
 
-    for file_path in destination.rglob("*"):
-        try:
-            if file_path.is_dir():
-                relative_parts = file_path.relative_to(destination).parts
-                if relative_parts and relative_parts[0] == HISTORY_DIR_NAME:
-                    continue
-                if not matches_patterns(file_path.name, patterns):
-                    continue
-                yield file_path
-            elif file_path.is_file():
-                relative_parts = file_path.relative_to(destination).parts
-                if relative_parts and relative_parts[0] == HISTORY_DIR_NAME:
-                    continue
-                if file_path.suffix == ".part":
-                    continue
-                if not matches_patterns(file_path.name, patterns):
-                    continue
-                yield file_path
-        except Exception:
-            logging.exception("Failed to evaluate retention for %s", file_path)
+    root = os.fspath(destination)
+    root_len = len(os.path.join(root, ""))
+    convert_sep = os.sep != "/"
+    cache = dir_cache or DirCache()
+    is_match = compile_patterns(patterns)
+    for dirpath, files, dirs in cache.walk(root, frozenset((HISTORY_DIR_NAME,))):
+        at_root = dirpath is root
+        prefix = os.path.join(dirpath, "")
+        key_prefix = prefix[root_len:]
+        if convert_sep:
+            key_prefix = key_prefix.replace(os.sep, "/")
+        for name in dirs:
+            if at_root and name == HISTORY_DIR_NAME:
+                continue
+            if is_match(name):
+                yield prefix + name, key_prefix + name, True
+        for name in files:
+            if at_root and name == HISTORY_DIR_NAME:
+                continue
+            if name.endswith(".part"):
+                continue
+            if is_match(name):
+                yield prefix + name, key_prefix + name, False
+
 
+def _history_value_to_epoch(history_value: str) -> float:
+    """히스토리 ISO 문자열(naive면 UTC로 간주)을 epoch 초로 변환."""
+    synced_at = datetime.fromisoformat(history_value)
+    if synced_at.tzinfo is None:
+        synced_at = synced_at.replace(tzinfo=timezone.utc)
+    return synced_at.timestamp()
 
-def _resolve_entry_timestamp(path: Path, history_value: Optional[str]) -> datetime:
-    """히스토리 값 또는 파일/디렉터리 mtime으로 대표 타임스탬프 산출."""
-    if history_value:
+
+def build_history_epochs(sync_history: Dict[str, str]) -> Dict[str, float]:
+    """히스토리 ISO 문자열을 한 번만 파싱해 {키: epoch 초} 맵을 만든다."""
+    epochs: Dict[str, float] = {}
+    for key, value in sync_history.items():
         try:
-            return datetime.fromisoformat(history_value)
+            epochs[key] = _history_value_to_epoch(value)
         except ValueError:
-            logging.warning("Invalid sync history timestamp for %s", path)
+            logging.warning("Invalid sync history timestamp for %s", key)
+    return epochs
+
+
+def _lookup_history_epoch(
+    history_key: str,
+    sync_history: Dict[str, str],
+    history_epochs: Optional[Dict[str, float]],
+) -> Optional[float]:
+    if history_epochs is not None:
+        return history_epochs.get(history_key)
+    history_value = sync_history.get(history_key)
+    if not history_value:
+        return None
+    try:
+        return _history_value_to_epoch(history_value)
+    except ValueError:
+        logging.warning("Invalid sync history timestamp for %s", history_key)
+        return None
+
+
+def _resolve_entry_timestamp(
+    path: Path | str,
+    history_epoch: Optional[float],
+    is_dir: bool = False,
+) -> float:
+    """히스토리 시각 또는 파일/디렉터리 mtime으로 대표 타임스탬프(epoch 초) 산출."""
+    if history_epoch is not None:
+        return history_epoch
 
     try:
-        base_mtime = path.stat().st_mtime
+        base_mtime = os.stat(path).st_mtime
     except FileNotFoundError:
-        return datetime.utcfromtimestamp(0)
+        return 0.0
 
-    if path.is_file():
-        return datetime.fromtimestamp(base_mtime)
+    if not is_dir:
+        return base_mtime
 
     newest = base_mtime
+    stack = [os.fspath(path)]
     try:
-        for child in path.rglob("*"):
-            try:
-                newest = max(newest, child.stat().st_mtime)
-            except FileNotFoundError:
-                continue
-    except Exception:
-        logging.exception("Failed to scan directory mtime for %s", path)
-    return datetime.fromtimestamp(newest)
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        newest = max(newest, entry.stat().st_mtime)
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except FileNotFoundError:
+                        continue
+    except OSError as exc:
+        logging.warning("Failed to scan directory mtime for %s: %s", path, exc)
+    return newest
 
 
-def _delete_entry(path: Path) -> None:
+def _delete_entry(path: Path | str, is_dir: Optional[bool] = None) -> None:
     """파일 또는 디렉터리를 안전하게 삭제."""
-    if path.is_dir():
+    if is_dir is None:
+        is_dir = os.path.isdir(path)
+    if is_dir:
         shutil.rmtree(path, ignore_errors=False)
     else:
-        path.unlink()
+        os.unlink(path)
 
 
 def _enforce_days_retention(
@@ -612,31 +1336,42 @@ def _enforce_days_retention(
     patterns: list[str],
     sync_history: Dict[str, str],
     retention_days: int,
+    dir_cache: Optional[DirCache] = None,
+    history_epochs: Optional[Dict[str, float]] = None,
 ) -> bool:
     if retention_days <= 0:
         return False
     if not destination.exists():
         return False
 
-    threshold = datetime.utcnow() - timedelta(days=retention_days)
+    # epoch 초끼리 비교하므로 항목마다 datetime을 만들 필요가 없다.
+    threshold = time.time() - retention_days * 86400
     deleted = 0
     history_changed = False
     history_keys_to_remove: set[str] = set()
 
-    for file_path in _iter_backup_entries(destination, patterns):
+    for file_path, history_key, is_dir in _iter_backup_entries(destination, patterns, dir_cache):
+        history_epoch = _lookup_history_epoch(history_key, sync_history, history_epochs)
         try:
-            history_key = build_history_key(destination, file_path)
-            synced_at = _resolve_entry_timestamp(file_path, sync_history.get(history_key))
-
-            if synced_at < threshold:
-                _delete_entry(file_path)
-                deleted += 1
-                history_keys_to_remove.add(history_key)
-                logging.info("Removed expired backup: %s", file_path)
-        except Exception:
-            logging.exception("Failed to evaluate retention for %s", file_path)
+            synced_at = _resolve_entry_timestamp(file_path, history_epoch, is_dir)
+        except OSError as exc:
+            logging.warning("Failed to evaluate retention for %s: %s", file_path, exc)
+            continue
+        if synced_at >= threshold:
+            continue
+
+        try:
+            _delete_entry(file_path, is_dir)
+        except OSError as exc:
+            logging.warning("Failed to remove expired backup %s: %s", file_path, exc)
+            continue
+        deleted += 1
+        history_keys_to_remove.add(history_key)
+        logging.info("Removed expired backup: %s", file_path)
 
     for key in history_keys_to_remove:
+        if history_epochs is not None:
+            history_epochs.pop(key, None)
         if sync_history.pop(key, None) is not None:
             history_changed = True
 
@@ -651,21 +1386,24 @@ def _enforce_count_retention(
     patterns: list[str],
     sync_history: Dict[str, str],
     retention_limit: int,
+    dir_cache: Optional[DirCache] = None,
+    history_epochs: Optional[Dict[str, float]] = None,
 ) -> bool:
     if retention_limit <= 0:
         return False
     if not destination.exists():
         return False
 
-    file_entries: list[tuple[Path, datetime, str]] = []
+    file_entries: list[tuple[str, float, str, bool]] = []
 
-    for file_path in _iter_backup_entries(destination, patterns):
+    for file_path, history_key, is_dir in _iter_backup_entries(destination, patterns, dir_cache):
+        history_epoch = _lookup_history_epoch(history_key, sync_history, history_epochs)
         try:
-            history_key = build_history_key(destination, file_path)
-            synced_at = _resolve_entry_timestamp(file_path, sync_history.get(history_key))
-            file_entries.append((file_path, synced_at, history_key))
-        except Exception:
-            logging.exception("Failed to evaluate retention for %s", file_path)
+            synced_at = _resolve_entry_timestamp(file_path, history_epoch, is_dir)
+        except OSError as exc:
+            logging.warning("Failed to evaluate retention for %s: %s", file_path, exc)
+            continue
+        file_entries.append((file_path, synced_at, history_key, is_dir))
 
     if len(file_entries) <= retention_limit:
         return False
@@ -674,40 +1412,39 @@ def _enforce_count_retention(
     targets = sorted_entries[retention_limit:]
     history_changed = False
 
-    for file_path, _, history_key in targets:
+    for file_path, _, history_key, is_dir in targets:
         try:
-            _delete_entry(file_path)
-            if sync_history.pop(history_key, None) is not None:
-                history_changed = True
-            logging.info("Removed overflow backup: %s", file_path)
-        except Exception:
-            logging.exception("Failed to remove overflow file: %s", file_path)
+            _delete_entry(file_path, is_dir)
+        except OSError as exc:
+            logging.warning("Failed to remove overflow file %s: %s", file_path, exc)
+            continue
+        if history_epochs is not None:
+            history_epochs.pop(history_key, None)
+        if sync_history.pop(history_key, None) is not None:
+            history_changed = True
+        logging.info("Removed overflow backup: %s", file_path)
 
     return history_changed
 
 
-def get_existing_backups(destination: Path, patterns: list[str]) -> Dict[str, int]:
-    existing: Dict[str, int] = {}
+def get_existing_backups(
+    destination: Path,
+    patterns: list[str],
+    dir_cache: Optional[DirCache] = None,
+) -> Dict[str, tuple[int, int]]:
+    """Replica의 기존 백업을 {posix 상대 경로: (크기, mtime_ns)}로 반환한다."""
+    existing: Dict[str, tuple[int, int]] = {}
     if not destination.exists():
         return existing
-    for file_path in destination.rglob("*"):
-        if not file_path.is_file():
+    root = os.fspath(destination)
+    root_len = len(os.path.join(root, ""))
+    history_entry = os.path.join(root, HISTORY_DIR_NAME)
+    cache = dir_cache or DirCache()
+    entries = cache.walk_matching(root, compile_patterns(patterns), frozenset((HISTORY_DIR_NAME,)))
+    for file_path, size, _, mtime_ns in entries:
+        if file_path.endswith(".part") or file_path == history_entry:
             continue
-        if file_path.suffix == ".part":
-            continue
-        try:
-            relative_parts = file_path.relative_to(destination).parts
-        except ValueError:
-            continue
-        if relative_parts and relative_parts[0] == HISTORY_DIR_NAME:
-            continue
-        if not matches_patterns(file_path.name, patterns):
-            continue
-        try:
-            rel_key = file_path.relative_to(destination).as_posix()
-        except ValueError:
-            rel_key = file_path.name
-        existing[rel_key] = file_path.stat().st_size
+        existing[file_path[root_len:].replace(os.sep, "/")] = (size, mtime_ns)
     return existing
 
 
@@ -721,10 +1458,21 @@ class FileSyncManager:
     ):
         self.config = config
         self.config_id = config_id
+        self._source_str = os.fspath(config.source)
+        self._dest_str = os.fspath(config.destination)
+        self._source_parts = config.source.parts
+        self._source_parts_len = len(self._source_parts)
+        # 이미 만들어 둔 Replica 하위 폴더 (보존 정리 후에는 비운다)
+        self._created_dirs: set[str] = set()
         self.running = False
         self._stop_event = threading.Event()
+        # 중지 요청이나 쓰기 완료(close) 이벤트가 오면 루프 대기를 즉시 깨운다.
+        self._wake_event = threading.Event()
+        # 상태 dict는 게시 후 변경하지 않는다 (copy-on-write). 잠금은 쓰기끼리만 직렬화하고,
+        # 읽기는 현재 참조를 그대로 읽는다 (참조 교체는 원자적).
         self._status_lock = threading.Lock()
-        self._status = {
+        self._last_iso_ts: tuple[int, str] = (0, "")
+        self._status: Dict[str, object] = {
             "state": "IDLE",
             "current_file": "",
             "progress_percent": 0,
@@ -732,33 +1480,61 @@ class FileSyncManager:
             "last_sync_time": "",
             "updated_at": "",
         }
-        self.pending_files: Dict[Path, PendingFile] = {}
+        # 대기 파일 {경로 문자열: PendingFile}. 해시/비교 비용이 싼 str 키를 쓰고 Path는 info.path에 둔다.
+        self.pending_files: Dict[str, PendingFile] = {}
+        # (다음 검사 시각, 경로) 최소 힙. 무효 항목은 꺼낼 때 check_at 비교로 버린다.
+        self._settle_heap: list[tuple[float, str]] = []
         self._event_queue: Queue = Queue()
         self._delete_queue: Queue = Queue()
         self._observer: Optional[BaseObserver] = None
-        self._existing_backups: Dict[str, int] = {}
+        # {소스 상대 경로: (크기, mtime_ns)} — 복사 후 mtime을 원본과 맞추므로 동일 여부 판별에 쓴다.
+        self._existing_backups: Dict[str, tuple[int, int]] = {}
+        # 소스/대상 트리 목록을 스냅샷·기존 백업 조회·보존 정리가 함께 재사용한다.
+        self._source_dir_cache = DirCache(config.exclude_dir_matcher)
+        self._dest_dir_cache = DirCache(config.exclude_dir_matcher)
         self.history_path = history_file_path(self.config.destination)
         self.sync_history: Dict[str, str] = load_sync_history(self.history_path)
+        # 보존 정리용 epoch 맵 (디스크에는 ISO 문자열만 저장, 두 맵은 함께 갱신)
+        self._history_epochs: Dict[str, float] = build_history_epochs(self.sync_history)
+        self._journal_lines = 0
         self._queue_total_bytes = 0
         self._queue_completed_bytes = 0
+        self._tick_percent_cache: Optional[int] = None
+        self._copy_pool: Optional[ThreadPoolExecutor] = None
+        # 병렬 복사 중인 파일별 복사량 {원본 경로 문자열: 복사량} (진행률 합산용, 워커 스레드가 갱신)
+        self._inflight_lock = threading.Lock()
+        self._inflight_copied: Dict[str, int] = {}
+        # 복사 풀에 제출되어 아직 결과를 반영하지 않은 파일 (루프 스레드 전용)
+        self._in_flight: Dict[str, tuple[Future, PendingFile, str]] = {}
+        # 복사 중에 다시 변경이 감지된 경로. 결과 반영 후 복사한 내용과 다르면 다시 대기열에 넣는다.
+        self._recheck_after_copy: set[str] = set()
+        self._holds_copy_slot = False
         self._status_callback = status_callback
         self._copy_coordinator = copy_coordinator or _copy_coordinator
         self._last_wait_notice = 0.0
         self._rescan_interval = max(0, getattr(self.config, "scan_interval_seconds", 0))
         self._last_rescan_time = 0.0
-        self._count_retention_cache: Optional[set[Path]] = None
+        self._events_since_rescan = False
+        self._rescan_skips = 0
+        # 복사에 실패해 대기열에서 빠진 파일이 있음. 다음 주기적 스캔은 생략하지 않고 재시도한다.
+        self._retry_on_rescan = False
+        self._last_retention_ts = 0.0
+        self._retention_due = False
+        self._count_retention_cache: Optional[set[str]] = None
         self._count_retention_cache_time = 0.0
         self._count_retention_cache_ttl = 2.0
 
     def _reset_queue_progress(self) -> None:
         self._queue_total_bytes = 0
         self._queue_completed_bytes = 0
+        self._tick_percent_cache = None
         self._update_status(progress_percent=0)
 
     def _add_queue_bytes(self, size: int) -> None:
         if size <= 0:
             return
         self._queue_total_bytes += size
+        self._tick_percent_cache = None
 
     def _remove_queue_bytes(self, size: int) -> None:
         if size <= 0:
@@ -766,43 +1542,70 @@ class FileSyncManager:
         self._queue_total_bytes = max(0, self._queue_total_bytes - size)
         if self._queue_completed_bytes > self._queue_total_bytes:
             self._queue_completed_bytes = self._queue_total_bytes
+        self._tick_percent_cache = None
+
+    def _add_completed_bytes(self, size: int) -> None:
+        self._queue_completed_bytes += size
+        self._tick_percent_cache = None
 
     def _calculate_overall_percent(self, current_copied: int = 0) -> int:
+        """대기열 전체 진행률(%)을 계산.
+
+        진행 중인 복사량이 없는 호출은 틱 단위로 캐시하며, 대기열 바이트가
+        바뀌거나 새 틱이 시작되면 캐시를 비운다.
+        """
+        if current_copied <= 0 and self._tick_percent_cache is not None:
+            return self._tick_percent_cache
         total_bytes = self._queue_total_bytes
         if total_bytes <= 0:
-            return 0
-        completed_bytes = self._queue_completed_bytes + max(0, current_copied)
-        percent = int((float(completed_bytes) / float(total_bytes)) * 100)
-        return min(100, percent)
+            percent = 0
+        else:
+            completed_bytes = self._queue_completed_bytes + max(0, current_copied)
+            percent = min(100, int((float(completed_bytes) / float(total_bytes)) * 100))
+        if current_copied <= 0:
+            self._tick_percent_cache = percent
+        return percent
+
+    def _get_state(self) -> str:
+        """상태 dict 전체를 복사하지 않고 현재 state만 읽는다."""
+        return self._status.get("state", "")
 
     def _mark_queue_active(self, details: str = "") -> None:
-        status = self.get_status()
+        status = self._status
         state = status.get("state", "")
+        current_file = status.get("current_file", "")
         if state in ("IDLE", "STOPPED"):
             self._update_status(
                 state="SCANNING",
                 details=details or "Pending files detected",
-                current_file=status.get("current_file", ""),
+                current_file=current_file,
                 progress_percent=self._calculate_overall_percent(),
             )
 
     def _notify_status(self, status_snapshot: Dict[str, str]) -> None:
         if not self._status_callback:
             return
-        try:
-            self._status_callback(status_snapshot)
-        except Exception:
-            logging.exception("Status callback failed.")
+        _status_notifier.submit(id(self), self._status_callback, status_snapshot)
 
     def _update_status(self, notify: bool = True, **kwargs) -> None:
-        status_snapshot: Dict[str, str] = {}
+        kwargs["updated_at"] = self._status_timestamp()
         with self._status_lock:
-            self._status.update(kwargs)
-            self._status["updated_at"] = datetime.utcnow().isoformat()
-            status_snapshot = dict(self._status)
+            status_snapshot = {**self._status, **kwargs}
+            self._status = status_snapshot
         if notify:
+            # 게시된 dict는 다시 변경되지 않으므로 복사 없이 그대로 넘긴다.
             self._notify_status(status_snapshot)
 
+    def _status_timestamp(self) -> str:
+        """상태 표시용 UTC ISO 시각 (초 단위). 같은 초 안에서는 캐시된 문자열을 재사용한다."""
+        now = int(time.time())
+        cached_second, cached_iso = self._last_iso_ts
+        if now == cached_second:
+            return cached_iso
+        iso = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        self._last_iso_ts = (now, iso)
+        return iso
+
     def _on_waiting_for_slot(
         self,
         config_id: int,
@@ -816,8 +1619,7 @@ class FileSyncManager:
             return
         self._last_wait_notice = now
         blocker = active_id if active_id and active_id != config_id else next_candidate
-        with self._status_lock:
-            current_file = self._status.get("current_file", "")
+        current_file = self._status.get("current_file", "")
         detail = "동일 소스 경합 대기 중"
         if blocker and blocker != config_id:
             detail = f"config {blocker} 작업 완료 대기 중"
@@ -850,11 +1652,15 @@ class FileSyncManager:
         self._copy_coordinator.abandon(self.config.source, self.config_id)
         self._last_wait_notice = 0.0
 
-    def _progress_callback(self, filename: str, copied: int, total: int) -> None:
+    def _progress_callback(self, path_key: str, filename: str, copied: int, total: int) -> None:
+        # 표시 문자열은 상태 잠금 밖에서 만든다 (_update_status는 dict 갱신만 잠금 안에서 수행).
         detail = f"Copying {filename}"
         if total:
             detail = f"{filename}: {format_size(copied)} / {format_size(total)}"
-        overall_percent = self._calculate_overall_percent(copied)
+        with self._inflight_lock:
+            self._inflight_copied[path_key] = copied
+            inflight_total = sum(self._inflight_copied.values())
+        overall_percent = self._calculate_overall_percent(inflight_total)
         self._update_status(
             state="COPYING",
             current_file=filename,
@@ -863,22 +1669,41 @@ class FileSyncManager:
         )
 
     def get_status(self) -> Dict[str, str]:
-        with self._status_lock:
-            return dict(self._status)
+        return dict(self._status)
 
     def _persist_history(self) -> None:
+        """전체 히스토리를 스냅샷으로 기록하고 저널을 비운다 (압축)."""
         save_sync_history(self.history_path, self.sync_history)
+        self._journal_lines = 0
 
-    def _record_sync(self, destination_path: Path) -> None:
-        key = build_history_key(self.config.destination, destination_path)
-        self.sync_history[key] = datetime.utcnow().isoformat()
-        self._persist_history()
+    def _journal_history(self, entries: list[tuple[str, Optional[str]]]) -> None:
+        """변경분만 저널에 추가하고, 저널이 충분히 커지면 압축한다."""
+        self._journal_lines += append_sync_history(self.history_path, entries)
+        if self._journal_lines > max(HISTORY_COMPACT_MIN_LINES, 4 * len(self.sync_history)):
+            self._persist_history()
 
-    def queue_file_event(self, file_path: Path) -> None:
+    def _record_sync(self, destination_path: Path, history_key: Optional[str] = None) -> str:
+        """히스토리에 동기화 시각을 기록하고, 기록한 ISO 문자열을 반환한다."""
+        key = history_key or build_history_key(self.config.destination, destination_path)
+        now = time.time()
+        synced_at = datetime.utcfromtimestamp(now).isoformat()
+        self.sync_history[key] = synced_at
+        self._history_epochs[key] = now
+        self._journal_history([(key, synced_at)])
+        return synced_at
+
+    def _forget_history(self, key: str) -> bool:
+        """히스토리 두 맵에서 키를 제거하고, 실제로 있었는지 반환."""
+        self._history_epochs.pop(key, None)
+        return self.sync_history.pop(key, None) is not None
+
+    def queue_file_event(self, file_path: Path, write_closed: bool = False) -> None:
         if not self.running:
             return
         try:
-            self._event_queue.put_nowait(Path(file_path))
+            self._event_queue.put_nowait((Path(file_path), write_closed))
+            if write_closed:
+                self._wake_event.set()
         except Exception:
             logging.exception("Failed to queue file event: %s", file_path)
 
@@ -892,9 +1717,9 @@ class FileSyncManager:
 
     def _register_pending_file(
         self,
-        file_path: Path,
+        file_path: Path | str,
         reason: str = "",
-        count_retention_allowed: Optional[set[Path]] = None,
+        count_retention_allowed: Optional[set[str]] = None,
     ) -> bool:
         try:
             normalized_path = Path(file_path).resolve()
@@ -909,12 +1734,15 @@ class FileSyncManager:
         except ValueError:
             return False
 
-        if not matches_patterns(normalized_path.name, self.config.patterns):
+        if not self.config.pattern_matcher(normalized_path.name):
+            return False
+
+        if self._in_excluded_dir(relative_path.parts):
             return False
 
         if self.config.retention_mode == "count" and self.config.retention > 0:
             if count_retention_allowed is not None:
-                if normalized_path not in count_retention_allowed:
+                if os.fspath(normalized_path) not in count_retention_allowed:
                     return False
             else:
                 if not self._is_within_count_retention_limit(normalized_path):
@@ -926,51 +1754,108 @@ class FileSyncManager:
             return False
 
         file_key = relative_path.as_posix()
-        dest_size = self._existing_backups.get(file_key)
-        if dest_size is not None and dest_size == stat.st_size:
+        if _is_same_backup(self._existing_backups.get(file_key), stat.st_size, stat.st_mtime_ns):
+            return False
+
+        path_key = os.fspath(normalized_path)
+        if path_key in self._in_flight:
+            # 복사 중에 바뀐 파일은 완료 반영 후 다시 확인한다 (_collect_finished_copies).
+            self._recheck_after_copy.add(path_key)
             return False
+        if path_key in self.pending_files:
+            return False
+
+        self._enqueue_pending(normalized_path, stat.st_size, stat.st_mtime, reason)
+        return True
 
-        if normalized_path in self.pending_files:
+    def _in_excluded_dir(self, relative_parts: tuple[str, ...]) -> bool:
+        """소스 상대 경로의 상위 디렉터리 중 제외 패턴에 걸리는 것이 있는지 확인."""
+        matcher = self.config.exclude_dir_matcher
+        if matcher is None:
             return False
+        return any(matcher(part) for part in relative_parts[:-1])
 
+    def _enqueue_pending(self, path: Path, size: int, mtime: float, reason: str = "") -> None:
         if not self.pending_files:
             self._reset_queue_progress()
 
-        self.pending_files[normalized_path] = PendingFile(
-            path=normalized_path,
-            last_size=stat.st_size,
-            last_mtime=stat.st_mtime,
+        info = PendingFile(
+            path=path,
+            last_size=size,
+            last_mtime=mtime,
             stable_since=time.time(),
         )
-        self._add_queue_bytes(stat.st_size)
+        key = os.fspath(path)
+        self.pending_files[key] = info
+        self._schedule_check(key, info, info.stable_since + self.config.settle_seconds)
+        self._add_queue_bytes(size)
         label = reason or "변경 감지"
-        self._mark_queue_active(f"{normalized_path.name} {label}")
+        self._mark_queue_active(f"{path.name} {label}")
         logging.info(
             "대기열 등록 - %s: %s (%s), 총 대기 파일: %s개",
             label,
-            normalized_path.name,
-            format_size(stat.st_size),
+            path.name,
+            format_size(size),
             len(self.pending_files),
         )
-        return True
 
-    def _update_count_retention_cache(self, allowed: set[Path]) -> None:
+    def _scan_source(self, initial: bool = False) -> list[tuple[str, int, float, int]]:
+        """소스를 순회해 대기열 후보 (경로, 크기, mtime, mtime_ns) 목록을 반환한다.
+
+        count 보존 모드에서는 최신 N개만 남기고 보존 캐시도 함께 갱신한다.
+        """
+        entries = self._source_dir_cache.walk_matching(
+            self._source_str, self.config.pattern_matcher
+        )
+
+        if self.config.retention_mode == "count" and self.config.retention > 0:
+            entries.sort(key=lambda entry: entry[2], reverse=True)
+            limit = min(self.config.retention, len(entries))
+            if initial and len(entries) > limit:
+                logging.info(
+                    "Count retention mode - limiting initial sync to %s of %s source files",
+                    limit,
+                    len(entries),
+                )
+            entries = entries[:limit]
+            self._update_count_retention_cache({entry[0] for entry in entries})
+        return entries
+
+    def _register_scanned_files(self, entries: list[tuple[str, int, float, int]], reason: str) -> int:
+        """순회 결과를 대기열에 등록하고 추가된 개수를 반환한다.
+
+        순회 중 얻은 크기/mtime을 그대로 쓰므로 파일마다 resolve/stat을 다시 하지 않고,
+        대상에 같은 크기·mtime으로 이미 있는 대부분의 파일은 Path 객체도 만들지 않고 건너뛴다.
+        """
+        existing = self._existing_backups
+        in_flight = self._in_flight
+        prefix_len = len(os.path.join(self._source_str, ""))
+        convert_sep = os.sep != "/"
+        added = 0
+        for file_path, size, mtime, mtime_ns in entries:
+            file_key = file_path[prefix_len:]
+            if convert_sep:
+                file_key = file_key.replace(os.sep, "/")
+            if _is_same_backup(existing.get(file_key), size, mtime_ns):
+                continue
+            if file_path in in_flight:
+                self._recheck_after_copy.add(file_path)
+                continue
+            if file_path in self.pending_files:
+                continue
+            self._enqueue_pending(Path(file_path), size, mtime, reason)
+            added += 1
+        return added
+
+    def _update_count_retention_cache(self, allowed: set[str]) -> None:
         self._count_retention_cache = allowed
         self._count_retention_cache_time = time.time()
 
-    def _refresh_count_retention_cache(self) -> set[Path]:
-        matches = snapshot_matching_files(self.config.source, self.config.patterns)
-        items = list(matches.items())
-        if not items:
-            allowed: set[Path] = set()
-        else:
-            items.sort(key=lambda item: item[1], reverse=True)
-            limit = min(self.config.retention, len(items))
-            allowed = {path for path, _ in items[:limit]}
-        self._update_count_retention_cache(allowed)
-        return allowed
+    def _refresh_count_retention_cache(self) -> set[str]:
+        self._scan_source()
+        return self._count_retention_cache
 
-    def _get_count_retention_allowed(self, force_refresh: bool = False) -> Optional[set[Path]]:
+    def _get_count_retention_allowed(self, force_refresh: bool = False) -> Optional[set[str]]:
         if self.config.retention_mode != "count" or self.config.retention <= 0:
             return None
         now = time.time()
@@ -986,30 +1871,87 @@ class FileSyncManager:
         allowed = self._get_count_retention_allowed(force_refresh=False)
         if allowed is None:
             return True
-        if file_path in allowed:
+        path_key = os.fspath(file_path)
+        if path_key in allowed:
             return True
         allowed = self._get_count_retention_allowed(force_refresh=True)
         if allowed is None:
             return True
-        return file_path in allowed
+        return path_key in allowed
 
-    def _pending_items_snapshot(self) -> list[tuple[Path, PendingFile]]:
-        items = list(self.pending_files.items())
-        if self.config.retention_mode == "count" and self.config.retention > 0:
-            items.sort(key=lambda entry: entry[1].last_mtime, reverse=True)
-        return items
+    def _discard_pending(self, processed_paths: list[str]) -> None:
+        """처리 완료된 경로를 대기열에서 제거.
+
+        대기열의 상당 부분(1/4 이상)이 한 번에 처리된 경우에는 항목별 pop 대신
+        남은 항목만으로 dict를 한 번에 재구성한다.
+        """
+        if processed_paths:
+            if len(processed_paths) >= len(self.pending_files) // 4:
+                processed_set = set(processed_paths)
+                self.pending_files = {
+                    path: info
+                    for path, info in self.pending_files.items()
+                    if path not in processed_set
+                }
+            else:
+                for path in processed_paths:
+                    self.pending_files.pop(path, None)
+        if not self.pending_files:
+            self._settle_heap.clear()
 
     def _drain_event_queue(self) -> int:
         added = 0
         while True:
             try:
-                path = self._event_queue.get_nowait()
+                path, write_closed = self._event_queue.get_nowait()
             except Empty:
                 break
+            self._events_since_rescan = True
             if self._register_pending_file(path, reason="변경 감지"):
                 added += 1
+            if write_closed:
+                self._mark_write_closed(path)
         return added
 
+    def _mark_write_closed(self, file_path: Path) -> None:
+        """쓰기 핸들이 닫힌 대기 파일을 즉시 안정화된 것으로 표시한다.
+
+        닫힌 시점의 크기/mtime을 기록해 두므로, 이후 다시 쓰기가 일어나면
+        CHECK_STABLE 단계에서 일반 안정화 타이머로 돌아간다.
+        """
+        try:
+            normalized_path = file_path.resolve()
+        except OSError:
+            return
+        key = os.fspath(normalized_path)
+        if key in self._in_flight:
+            # 워커가 이전 내용을 복사 중이므로 info는 건드리지 않고 완료 후 다시 확인한다.
+            self._recheck_after_copy.add(key)
+            return
+        info = self.pending_files.get(key)
+        if info is None:
+            return
+        try:
+            stat = normalized_path.stat()
+        except OSError:
+            return
+        size_delta = stat.st_size - info.last_size
+        if size_delta > 0:
+            self._add_queue_bytes(size_delta)
+        elif size_delta < 0:
+            self._remove_queue_bytes(-size_delta)
+        info.last_size = stat.st_size
+        info.last_mtime = stat.st_mtime
+        now = time.time()
+        info.stable_since = now - self.config.settle_seconds
+        info.write_closed = True
+        self._schedule_check(key, info, now)
+
+    def _schedule_check(self, key: str, info: PendingFile, check_at: float) -> None:
+        """안정화 힙에 다음 검사 시각을 넣는다. 이전 항목은 check_at 불일치로 무효가 된다."""
+        info.check_at = check_at
+        heapq.heappush(self._settle_heap, (check_at, key))
+
     def _drain_delete_queue(self) -> None:
         while True:
             try:
@@ -1017,38 +1959,48 @@ class FileSyncManager:
             except Empty:
                 break
 
-    def _handle_source_deletion(self, source_path: Path) -> tuple[bool, bool]:
+    def _handle_source_deletion(self, source_path: Path) -> tuple[bool, Optional[str]]:
         try:
             normalized_path = Path(source_path).resolve()
         except OSError:
-            return False, False
-
-        try:
-            relative_path = normalized_path.relative_to(self.config.source)
-        except ValueError:
-            return False, False
-
-        if not matches_patterns(relative_path.name, self.config.patterns):
-            return False, False
+            return False, None
 
-        target_path = self.config.destination / relative_path
-        history_key = build_history_key(self.config.destination, target_path)
-        history_changed = False
-
-        if not target_path.exists() or target_path.is_dir():
-            self._existing_backups.pop(relative_path.as_posix(), None)
-            history_changed = self.sync_history.pop(history_key, None) is not None
-            return False, history_changed
+        # 소스 루트 하위 경로인지 parts 비교로 판별 (relative_to 예외 비용 회피)
+        parts = normalized_path.parts
+        if (
+            len(parts) <= self._source_parts_len
+            or parts[: self._source_parts_len] != self._source_parts
+        ):
+            return False, None
+        relative_parts = parts[self._source_parts_len:]
+
+        if not self.config.pattern_matcher(relative_parts[-1]):
+            return False, None
+        if self._in_excluded_dir(relative_parts):
+            return False, None
+
+        # Replica 상대 경로와 히스토리 키는 동일한 posix 문자열
+        history_key = "/".join(relative_parts)
+        target_str = os.path.join(self._dest_str, *relative_parts)
+        # 두 번째 값: 히스토리에서 제거된 키 (저널에 삭제 표시로 기록)
+        removed_key = None
+
+        if not os.path.isfile(target_str):
+            self._existing_backups.pop(history_key, None)
+            if self._forget_history(history_key):
+                removed_key = history_key
+            return False, removed_key
 
         try:
-            target_path.unlink()
-            history_changed = self.sync_history.pop(history_key, None) is not None
-            self._existing_backups.pop(relative_path.as_posix(), None)
-            logging.info("Source 삭제 감지 -> Replica 삭제: %s", target_path)
-            return True, history_changed
+            os.unlink(target_str)
+            if self._forget_history(history_key):
+                removed_key = history_key
+            self._existing_backups.pop(history_key, None)
+            logging.info("Source 삭제 감지 -> Replica 삭제: %s", target_str)
+            return True, removed_key
         except Exception:
-            logging.exception("Failed to mirror deletion for %s", target_path)
-            return False, False
+            logging.exception("Failed to mirror deletion for %s", target_str)
+            return False, None
 
     def _process_delete_events(self) -> None:
         if self.config.retention_mode != "sync":
@@ -1056,7 +2008,9 @@ class FileSyncManager:
             return
 
         removed = 0
-        history_changed = False
+        removed_keys: list[tuple[str, Optional[str]]] = []
+
+        deferred: list[Path] = []
 
         while True:
             try:
@@ -1064,14 +2018,20 @@ class FileSyncManager:
             except Empty:
                 break
 
-            deleted, history_updated = self._handle_source_deletion(path)
+            if self._in_flight and os.fspath(path) in self._in_flight:
+                # 복사 중인 파일은 복사가 끝난 뒤 삭제를 반영해야 Replica가 남지 않는다.
+                deferred.append(path)
+                continue
+            deleted, removed_key = self._handle_source_deletion(path)
             if deleted:
                 removed += 1
-            if history_updated:
-                history_changed = True
+            if removed_key is not None:
+                removed_keys.append((removed_key, None))
 
-        if history_changed:
-            self._persist_history()
+        for path in deferred:
+            self._delete_queue.put_nowait(path)
+        if removed_keys:
+            self._journal_history(removed_keys)
         if removed:
             logging.info("삭제 동기화 처리 완료: %s개 파일", removed)
 
@@ -1085,7 +2045,7 @@ class FileSyncManager:
     def _start_observer(self) -> None:
         handler = _SyncEventHandler(self)
         observer = self._build_observer()
-        observer.schedule(handler, str(self.config.source), recursive=True)
+        observer.schedule(handler, self._source_str, recursive=True)
         observer.start()
         self._observer = observer
 
@@ -1100,146 +2060,336 @@ class FileSyncManager:
         finally:
             self._observer = None
 
-    def _process_pending_files(self):
-        now = time.time()
-        processed_paths = []
-
-        if self.pending_files:
-            logging.debug("대기열 상태 확인 - 총 %s개 파일 처리 중", len(self.pending_files))
+    def _scan_stability(
+        self,
+        now: float,
+        processed_paths: list[str],
+    ) -> list[tuple[Path, PendingFile]]:
+        """CHECK_STABLE 단계: 검사 시각이 된 파일만 stat하고 복사 가능한 파일을 반환.
+
+        대기 파일 전체를 매 틱 순회하지 않고 안정화 힙에서 기한이 지난 항목만 꺼낸다.
+        변화가 감지된 파일은 LOOP_INTERVAL_SECONDS 뒤에 다시 보고, 변화가 없으면
+        안정화 기한에 한 번만 확인한다. 사라진 파일이나 stat 오류가 난 파일은
+        processed_paths에 추가된다.
+        """
+        ready: list[tuple[Path, PendingFile]] = []
+        settle_seconds = self.config.settle_seconds
+        recheck_delay = min(settle_seconds, LOOP_INTERVAL_SECONDS)
+        heap = self._settle_heap
+        pending = self.pending_files
+        in_flight = self._in_flight
+
+        due: list[tuple[str, PendingFile]] = []
+        while heap and heap[0][0] <= now:
+            check_at, key = heapq.heappop(heap)
+            info = pending.get(key)
+            if info is None or info.check_at != check_at or key in in_flight:
+                continue
+            due.append((key, info))
+        if not due:
+            return ready
 
-        for file_path, info in self._pending_items_snapshot():
+        stats = _stat_many([info.path for _, info in due])
+        for key, info in due:
             if not self.running:
                 break
+            file_path = info.path
 
-            try:
-                if not file_path.exists():
+            stat = stats[file_path]
+            if isinstance(stat, OSError):
+                if isinstance(stat, FileNotFoundError):
                     logging.warning("File disappeared pending copy: %s", file_path)
-                    self._remove_queue_bytes(info.last_size)
-                    processed_paths.append(file_path)
-                    continue
+                else:
+                    logging.error("Error processing pending file: %s", file_path, exc_info=stat)
+                    self._retry_on_rescan = True
+                self._remove_queue_bytes(info.last_size)
+                processed_paths.append(key)
+                continue
 
-                stat = file_path.stat()
-                current_size = stat.st_size
-                current_mtime = stat.st_mtime
-
-                if current_size != info.last_size or current_mtime != info.last_mtime:
-                    size_delta = current_size - info.last_size
-                    if size_delta > 0:
-                        self._add_queue_bytes(size_delta)
-                    elif size_delta < 0:
-                        self._remove_queue_bytes(-size_delta)
-
-                    info.last_size = current_size
-                    info.last_mtime = current_mtime
-                    info.stable_since = now
-                    logging.debug(
-                        "대기열 - 파일 변경 감지: %s (%s), 안정화 타이머 리셋",
-                        file_path.name,
-                        format_size(current_size),
-                    )
-                    continue
+            current_size = stat.st_size
+            current_mtime = stat.st_mtime
+
+            if current_size != info.last_size or current_mtime != info.last_mtime:
+                size_delta = current_size - info.last_size
+                if size_delta > 0:
+                    self._add_queue_bytes(size_delta)
+                elif size_delta < 0:
+                    self._remove_queue_bytes(-size_delta)
+
+                info.last_size = current_size
+                info.last_mtime = current_mtime
+                info.stable_since = now
+                info.write_closed = False
+                self._schedule_check(key, info, now + recheck_delay)
+                logging.debug(
+                    "대기열 - 파일 변경 감지: %s (%s), 안정화 타이머 리셋",
+                    file_path.name,
+                    format_size(current_size),
+                )
+                continue
 
-                elapsed = now - info.stable_since
-                if elapsed >= self.config.settle_seconds:
-                    logging.info(
-                        "대기열 - 파일 안정화 완료: %s (%s), 대기시간: %.1fs, 복사 시작",
-                        file_path.name,
-                        format_size(current_size),
-                        elapsed,
-                    )
+            elapsed = now - info.stable_since
+            if elapsed < settle_seconds:
+                self._schedule_check(key, info, info.stable_since + settle_seconds)
+                continue
 
-                    try:
-                        file_key = file_path.relative_to(self.config.source).as_posix()
-                    except ValueError:
-                        file_key = file_path.name
-                    dest_size = self._existing_backups.get(file_key)
-                    overwrite = self.config.retention_mode == "sync"
-
-                    if dest_size is not None:
-                        if dest_size == current_size:
-                            self._remove_queue_bytes(current_size)
-                            processed_paths.append(file_path)
-                            continue
-                        if overwrite:
-                            logging.info("동기화 모드 - 기존 파일 덮어쓰기: %s", file_path.name)
-                        else:
-                            overwrite = True
-                            logging.warning("Incomplete backup detected for %s, overwriting.", file_path.name)
-
-                    copy_slot_acquired = self._acquire_copy_slot()
-                    if not copy_slot_acquired:
-                        self._remove_queue_bytes(current_size)
-                        processed_paths.append(file_path)
-                        break
-
-                    self._update_status(
-                        state="COPYING",
-                        current_file=file_path.name,
-                        details=f"Starting copy for {file_path.name}",
-                        progress_percent=self._calculate_overall_percent(),
-                    )
+            if info.write_closed:
+                logging.info(
+                    "대기열 - 쓰기 종료 감지: %s (%s), 안정화 대기 생략, 복사 시작",
+                    file_path.name,
+                    format_size(current_size),
+                )
+            else:
+                logging.info(
+                    "대기열 - 파일 안정화 완료: %s (%s), 대기시간: %.1fs, 복사 시작",
+                    file_path.name,
+                    format_size(current_size),
+                    elapsed,
+                )
+            ready.append((file_path, info))
 
-                    try:
-                        copied_path = copy_backup(
-                            file_path,
-                            self.config.destination,
-                            self.config.source,
-                            overwrite_existing=overwrite,
-                            progress_callback=self._progress_callback,
-                            cancel_event=self._stop_event,
-                        )
-                    except CopyCancelled:
-                        logging.info("Copy operation cancelled for %s", file_path.name)
-                        self._remove_queue_bytes(info.last_size)
-                        processed_paths.append(file_path)
-                        break
-                    finally:
-                        self._release_copy_slot()
-
-                    if copied_path:
-                        self._existing_backups[file_key] = current_size
-                        self._record_sync(copied_path)
-                        self._queue_completed_bytes += current_size
-                        overall_percent = self._calculate_overall_percent()
-                        self._update_status(
-                            state="COPYING",
-                            current_file="",
-                            details=f"Synced: {file_path.name}",
-                            last_sync_time=datetime.utcnow().isoformat(),
-                            progress_percent=overall_percent,
-                        )
-                        history_changed = enforce_retention(
-                            self.config.destination,
-                            self.config.retention,
-                            self.config.patterns,
-                            self.sync_history,
-                            self.config.retention_mode,
-                        )
-                        if history_changed:
-                            self._persist_history()
-                    else:
-                        self._remove_queue_bytes(current_size)
+        if self.config.retention_mode == "count" and self.config.retention > 0:
+            ready.sort(key=lambda entry: entry[1].last_mtime, reverse=True)
+        return ready
 
-                    processed_paths.append(file_path)
+    def _prepare_copy(
+        self,
+        file_path: Path,
+        info: PendingFile,
+        processed_paths: list[str],
+    ) -> Optional[tuple[str, bool]]:
+        """복사가 필요하면 (file_key, overwrite)를 반환하고, 동일한 백업이 이미 있으면 None."""
+        current_size = info.last_size
+        file_key = _fast_relpath(file_path, self._source_parts) or file_path.name
+        existing = self._existing_backups.get(file_key)
+        overwrite = self.config.retention_mode == "sync"
+
+        if existing is not None:
+            if _is_same_backup(existing, current_size, _mtime_to_ns(info.last_mtime)):
+                self._remove_queue_bytes(current_size)
+                processed_paths.append(os.fspath(file_path))
+                return None
+            if overwrite:
+                logging.info("동기화 모드 - 기존 파일 덮어쓰기: %s", file_path.name)
+            else:
+                overwrite = True
+                logging.warning("Incomplete backup detected for %s, overwriting.", file_path.name)
+        return file_key, overwrite
+
+    def _copy_one(
+        self, file_path: Path, file_key: str, overwrite: bool
+    ) -> Optional[tuple[Path, int, int]]:
+        """복사 워커 스레드에서 실행되는 단일 파일 복사.
+
+        (복사본 경로, 복사 기준 크기, 복사 기준 mtime_ns)를 반환한다. 기준 값은 복사 직전에
+        stat한 원본 값으로, 대기열의 안정화 기록과 달라도 실제 복사한 내용과 일치한다.
+        """
+        # 진행률은 copy_file_with_progress의 첫 콜백에서 즉시 갱신된다.
+        self._update_status(
+            state="COPYING",
+            current_file=file_path.name,
+            details=f"Starting copy for {file_path.name}",
+        )
+        source_stat = file_path.stat()
+        copied_path = copy_backup(
+            file_path,
+            self.config.destination,
+            self.config.source,
+            overwrite_existing=overwrite,
+            # 다른 폴더의 같은 이름 파일과 섞이지 않도록 전체 경로로 복사량을 구분한다.
+            progress_callback=partial(self._progress_callback, os.fspath(file_path)),
+            cancel_event=self._stop_event,
+            rel_path=file_key,
+            created_dirs=self._created_dirs,
+            preserve_metadata=self.config.preserve_metadata,
+            source_stat=source_stat,
+        )
+        if copied_path is None:
+            return None
+        return copied_path, source_stat.st_size, source_stat.st_mtime_ns
 
+    def _submit_copies(
+        self,
+        jobs: list[tuple[Path, PendingFile, str, bool]],
+        processed_paths: list[str],
+    ) -> None:
+        """COPYING 단계: 안정화된 파일들을 복사 풀에 제출하고 바로 반환한다.
+
+        루프 스레드는 복사를 기다리지 않고 이벤트 처리와 안정화 검사를 계속하며,
+        완료된 복사는 다음 루프에서 _collect_finished_copies가 반영한다.
+        소스 단위 COPY 슬롯은 진행 중인 복사가 하나라도 있는 동안 계속 잡고 있으므로,
+        같은 소스를 공유하는 다른 작업과의 직렬화는 그대로 유지된다.
+        """
+        if not self._holds_copy_slot:
+            if not self._acquire_copy_slot():
+                for file_path, info, _, _ in jobs:
+                    self._remove_queue_bytes(info.last_size)
+                    processed_paths.append(os.fspath(file_path))
+                return
+            self._holds_copy_slot = True
+
+        for file_path, info, file_key, overwrite in jobs:
+            future = self._copy_pool.submit(self._copy_one, file_path, file_key, overwrite)
+            self._in_flight[os.fspath(file_path)] = (future, info, file_key)
+            future.add_done_callback(self._on_copy_done)
+
+    def _on_copy_done(self, _future: Future) -> None:
+        # 복사 워커 스레드에서 호출된다. 결과 반영은 루프 스레드에 맡기고 깨우기만 한다.
+        self._wake_event.set()
+
+    def _collect_finished_copies(self) -> int:
+        """RECORD 단계: 끝난 복사의 결과를 루프 스레드에서 히스토리/진행률에 반영.
+
+        같은 틱의 안정화 검사가 다시 집어 가지 않도록 대기열에서 바로 제거하고,
+        처리한 파일 수를 반환한다.
+        """
+        finished = [
+            (key, entry)
+            for key, entry in self._in_flight.items()
+            if entry[0].done()
+        ]
+        for key, (future, info, file_key) in finished:
+            del self._in_flight[key]
+            self.pending_files.pop(key, None)
+            file_path = info.path
+            with self._inflight_lock:
+                self._inflight_copied.pop(key, None)
+            recheck = key in self._recheck_after_copy
+            self._recheck_after_copy.discard(key)
+            try:
+                result = future.result()
+            except (CopyCancelled, CancelledError):
+                logging.info("Copy operation cancelled for %s", file_path.name)
+                self._remove_queue_bytes(info.last_size)
+                continue
             except Exception:
                 logging.exception("Error processing pending file: %s", file_path)
                 self._remove_queue_bytes(info.last_size)
-                processed_paths.append(file_path)
+                self._retry_on_rescan = True
+                result = None
+            else:
+                if result is None:
+                    self._remove_queue_bytes(info.last_size)
+                    self._retry_on_rescan = True
+
+            if result is not None:
+                copied_path, copied_size, copied_mtime_ns = result
+                size_delta = copied_size - info.last_size
+                if size_delta > 0:
+                    self._add_queue_bytes(size_delta)
+                elif size_delta < 0:
+                    self._remove_queue_bytes(-size_delta)
+                self._record_copied_file(
+                    file_path,
+                    copied_path,
+                    file_key,
+                    copied_size,
+                    copied_mtime_ns,
+                )
+            if recheck:
+                # 복사한 내용(_existing_backups)과 현재 원본이 다를 때만 다시 등록된다.
+                self._register_pending_file(file_path, reason="복사 중 변경")
+        return len(finished)
 
-        for path in processed_paths:
-            self.pending_files.pop(path, None)
+    def _release_idle_copy_slot(self) -> None:
+        if self._holds_copy_slot and not self._in_flight:
+            self._holds_copy_slot = False
+            self._release_copy_slot()
 
-        if processed_paths:
+    def _record_copied_file(
+        self,
+        file_path: Path,
+        copied_path: Path,
+        file_key: str,
+        size: int,
+        mtime_ns: int,
+    ) -> None:
+        """RECORD 단계: 복사 완료된 파일을 히스토리/진행률/보존 정책에 반영."""
+        # 복사본의 mtime은 원본과 같게 맞춰지므로 복사 기준으로 stat한 원본 mtime을 기록한다.
+        self._existing_backups[file_key] = (size, mtime_ns)
+        # 이름이 바뀌지 않았다면(타임스탬프 접미사 없음) 히스토리 키는 소스 상대 경로와 같다.
+        history_key = file_key if copied_path.name == file_path.name else None
+        synced_at = self._record_sync(copied_path, history_key)
+        self._add_completed_bytes(size)
+        # 마지막 진행률 콜백(copied == total)과 동일한 값이므로 percent는 재계산하지 않는다.
+        self._update_status(
+            state="COPYING",
+            current_file="",
+            details=f"Synced: {file_path.name}",
+            # 히스토리에 기록한 시각을 그대로 써서 파일마다 시각을 두 번 포맷하지 않는다.
+            last_sync_time=synced_at,
+        )
+        # 보존 정리는 파일마다 돌리지 않고 대기열이 비었을 때 한 번에 수행한다.
+        self._retention_due = True
+
+    def _enforce_retention_now(self) -> None:
+        self._retention_due = False
+        self._last_retention_ts = time.time()
+        # 보존 정리가 폴더형 백업을 지울 수 있으므로 생성 폴더 캐시를 비운다.
+        self._created_dirs.clear()
+        history_changed = enforce_retention(
+            self.config.destination,
+            self.config.retention,
+            self.config.patterns,
+            self.sync_history,
+            self.config.retention_mode,
+            self._dest_dir_cache,
+            self._history_epochs,
+        )
+        if history_changed:
+            self._persist_history()
+
+    def _maybe_enforce_retention(self) -> None:
+        """대기열이 빈 뒤 복사분이 있었거나, 주기(최소 60초)가 지났으면 보존 정리.
+
+        주기 조건은 대기열 상태와 무관하게 적용해, 유입이 끊이지 않아도 정리가 밀리지 않게 한다.
+        """
+        if self.config.retention_mode == "sync":
+            return
+        drained = self._retention_due and not self.pending_files
+        interval = max(self._rescan_interval, RETENTION_MIN_INTERVAL_SECONDS)
+        if not drained and (time.time() - self._last_retention_ts) < interval:
+            return
+        try:
+            self._enforce_retention_now()
+        except Exception:
+            logging.exception("Retention enforcement failed.")
+
+    def _process_pending_files(self):
+        processed_paths: list[str] = []
+
+        if self.pending_files:
+            logging.debug("대기열 상태 확인 - 총 %s개 파일 처리 중", len(self.pending_files))
+
+        collected = self._collect_finished_copies() if self._in_flight else 0
+
+        ready = self._scan_stability(time.time(), processed_paths)
+
+        jobs: list[tuple[Path, PendingFile, str, bool]] = []
+        for file_path, info in ready:
+            if not self.running:
+                break
+            # _prepare_copy는 메모리 조회만 하므로 I/O 예외가 날 수 없다.
+            prepared = self._prepare_copy(file_path, info, processed_paths)
+            if prepared is not None:
+                jobs.append((file_path, info, *prepared))
+
+        if jobs and self.running:
+            self._submit_copies(jobs, processed_paths)
+
+        self._discard_pending(processed_paths)
+        self._release_idle_copy_slot()
+
+        if processed_paths or collected:
             logging.info(
                 "대기열 정리 완료: %s개 파일 처리됨, 남은 대기 파일: %s개",
-                len(processed_paths),
+                len(processed_paths) + collected,
                 len(self.pending_files),
             )
 
         if not self.pending_files and self.running:
             if self._queue_total_bytes and self._queue_completed_bytes < self._queue_total_bytes:
-                self._queue_completed_bytes = self._queue_total_bytes
+                self._add_completed_bytes(self._queue_total_bytes - self._queue_completed_bytes)
             self._update_status(
                 state="IDLE",
                 current_file="",
@@ -1247,6 +2397,18 @@ class FileSyncManager:
                 details="Watching for file changes...",
             )
 
+    def _next_tick_timeout(self) -> float:
+        """다음 루프까지 대기할 시간(초).
+
+        대기 중인 파일이 있으면 가장 먼저 안정화되는 시점까지만 기다리되,
+        변경 감지를 위해 LOOP_INTERVAL_SECONDS를 넘기지 않는다.
+        """
+        if not self._settle_heap:
+            # 진행 중인 복사만 남았으면 완료 콜백이 루프를 깨운다.
+            return LOOP_INTERVAL_SECONDS
+        remaining = self._settle_heap[0][0] - time.time()
+        return min(LOOP_INTERVAL_SECONDS, max(MIN_TICK_SECONDS, remaining))
+
     def _should_trigger_rescan(self) -> bool:
         if self._rescan_interval <= 0:
             return False
@@ -1255,57 +2417,45 @@ class FileSyncManager:
             return False
         return (time.time() - self._last_rescan_time) >= self._rescan_interval
 
-    def _perform_periodic_rescan(self) -> None:
-        self._last_rescan_time = time.time()
-        matches = snapshot_matching_files(self.config.source, self.config.patterns)
-        matches_items = list(matches.items())
-        count_allowed = None
+    def _can_skip_rescan(self) -> bool:
+        """지난 스캔 이후 파일 이벤트가 없고 디렉터리 구조도 그대로면 파일 stat을 생략한다.
 
-        if self.config.retention_mode == "count" and self.config.retention > 0:
-            matches_items.sort(key=lambda item: item[1], reverse=True)
-            limit = min(self.config.retention, len(matches_items))
-            matches_items = matches_items[:limit]
-            count_allowed = {path for path, _ in matches_items}
-            self._update_count_retention_cache(count_allowed)
+        디렉터리 목록은 캐시에서 mtime만 확인하므로 디렉터리 수만큼의 stat으로 끝난다.
+        누락된 이벤트에 대비해 RESCAN_MAX_SKIPS번 연속 생략한 뒤에는 전체 스캔을 한다.
+        복사에 실패한 파일이 있으면 디렉터리가 그대로여도 생략하지 않는다 (유일한 재시도 경로).
+        """
+        if (
+            self._events_since_rescan
+            or self._retry_on_rescan
+            or self._rescan_skips >= RESCAN_MAX_SKIPS
+        ):
+            return False
+        cache = self._source_dir_cache
+        for _ in cache.walk(self._source_str):
+            pass
+        if cache.last_walk_changed:
+            return False
+        self._rescan_skips += 1
+        return True
 
-        added = 0
-        for file_path, _ in matches_items:
-            if self._register_pending_file(
-                file_path,
-                reason="주기적 스캔",
-                count_retention_allowed=count_allowed,
-            ):
-                added += 1
+    def _perform_periodic_rescan(self) -> None:
+        self._last_rescan_time = time.time()
+        if self._can_skip_rescan():
+            logging.debug("주기적 스캔 생략 - 변경 없음 (%s회 연속)", self._rescan_skips)
+            return
+        self._events_since_rescan = False
+        self._retry_on_rescan = False
+        self._rescan_skips = 0
+        added = self._register_scanned_files(self._scan_source(), reason="주기적 스캔")
         if added:
             logging.info("주기적 스캔 - 신규 파일 %s개 대기열 추가", added)
 
     def _seed_initial_pending(self) -> None:
-        initial_matches = snapshot_matching_files(self.config.source, self.config.patterns)
-        matches_items = list(initial_matches.items())
-        count_allowed = None
-
-        if self.config.retention_mode == "count" and self.config.retention > 0:
-            matches_items.sort(key=lambda item: item[1], reverse=True)
-            limit = min(self.config.retention, len(matches_items))
-            if len(matches_items) > limit:
-                logging.info(
-                    "Count retention mode - limiting initial sync to %s of %s source files",
-                    limit,
-                    len(matches_items),
-                )
-            matches_items = matches_items[:limit]
-            count_allowed = {path for path, _ in matches_items}
-            self._update_count_retention_cache(count_allowed)
-
-        for file_path, _ in matches_items:
-            self._register_pending_file(
-                file_path,
-                reason="초기 스캔",
-                count_retention_allowed=count_allowed,
-            )
+        self._register_scanned_files(self._scan_source(initial=True), reason="초기 스캔")
 
     def run(self) -> None:
         self._stop_event.clear()
+        self._wake_event.clear()
         self.running = True
         self._update_status(
             state="SCANNING",
@@ -1324,21 +2474,31 @@ class FileSyncManager:
             self._update_status(state="STOPPED", details=str(exc))
             return
 
+        try:
+            self.history_path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            logging.exception("Failed to create history folder: %s", self.history_path.parent)
+
         self._existing_backups = get_existing_backups(
             self.config.destination,
             self.config.patterns,
+            self._dest_dir_cache,
         )
 
         # 서버/서비스 재기동 시점에도 기존 백업에 대해 보존 정책을 한 번 적용
         try:
+            self._last_retention_ts = time.time()
             history_changed = enforce_retention(
                 self.config.destination,
                 self.config.retention,
                 self.config.patterns,
                 self.sync_history,
                 self.config.retention_mode,
+                self._dest_dir_cache,
+                self._history_epochs,
             )
-            if history_changed:
+            # 이전 실행에서 남은 저널도 기동 시점에 스냅샷으로 합친다.
+            if history_changed or history_journal_path(self.history_path).exists():
                 self._persist_history()
         except Exception:
             logging.exception("Initial retention enforcement failed.")
@@ -1359,8 +2519,14 @@ class FileSyncManager:
                 details="Watching for file changes...",
             )
 
+        self._copy_pool = ThreadPoolExecutor(
+            max_workers=self.config.copy_workers,
+            thread_name_prefix=f"filesync-copy-{self.config_id}",
+        )
+
         try:
             while self.running and not self._stop_event.is_set():
+                self._tick_percent_cache = None
                 self._drain_event_queue()
                 self._process_delete_events()
                 if self._should_trigger_rescan():
@@ -1369,7 +2535,7 @@ class FileSyncManager:
                 if self.pending_files:
                     self._process_pending_files()
                 else:
-                    current_state = self.get_status().get("state")
+                    current_state = self._get_state()
                     if current_state not in ("IDLE", "STOPPED"):
                         self._update_status(
                             state="IDLE",
@@ -1377,23 +2543,59 @@ class FileSyncManager:
                             progress_percent=self._calculate_overall_percent(),
                             details="Watching for file changes...",
                         )
+                self._maybe_enforce_retention()
 
-                time.sleep(1)
+                self._wake_event.wait(timeout=self._next_tick_timeout())
+                self._wake_event.clear()
+                if self._stop_event.is_set():
+                    break
 
         except KeyboardInterrupt:
             logging.info("Stopping backup watcher.")
         finally:
             self.running = False
             self._stop_observer()
+            self._shutdown_copy_pool()
+            self._finish_in_flight_copies()
+            self._in_flight.clear()
+            self._recheck_after_copy.clear()
+            self._holds_copy_slot = False
+            # 워커가 .part 쓰기/교체를 마친 뒤에만 슬롯을 놓아, 같은 소스의 다른 작업과 겹치지 않게 한다.
             self._abandon_copy_slot()
             self._update_status(state="STOPPED", details="Sync stopped")
 
+    def _finish_in_flight_copies(self) -> None:
+        """진행 중인 복사가 중단 신호로 끝나기를 (최대 COPY_STOP_WAIT_SECONDS) 기다린 뒤 결과를 반영."""
+        if not self._in_flight:
+            return
+        # 풀 종료로 취소된 Future는 wait()가 완료로 보지 않으므로 done()으로 미리 걸러 낸다.
+        running = [entry[0] for entry in self._in_flight.values() if not entry[0].done()]
+        _, not_done = wait(running, timeout=COPY_STOP_WAIT_SECONDS)
+        if not_done:
+            logging.warning(
+                "%s copy worker(s) still running after %.0fs; releasing copy slot anyway.",
+                len(not_done),
+                COPY_STOP_WAIT_SECONDS,
+            )
+        try:
+            self._collect_finished_copies()
+        except Exception:
+            logging.exception("Failed to record finished copies on stop.")
+
+    def _shutdown_copy_pool(self) -> None:
+        """대기 중인 복사는 취소하고, 진행 중인 복사는 _stop_event로 중단되도록 둔다."""
+        pool = self._copy_pool
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
     def stop(self):
         logging.info("Stop signal received.")
         self._stop_event.set()
+        self._wake_event.set()
         self.running = False
         self._stop_observer()
-        self._abandon_copy_slot()
+        self._shutdown_copy_pool()
+        # 복사 슬롯은 진행 중인 복사가 끝난 뒤 run()의 종료 처리에서 놓는다.
         self._update_status(
             state="STOPPED",
             current_file="",
@@ -4,19 +4,23 @@ Flask 라우트 정의 모듈
 이 모듈은 애플리케이션의 모든 HTTP 라우트를 정의합니다.
 HTMX를 사용한 부분 렌더링과 서버 사이드 렌더링을 결합한 하이브리드 방식으로 구현되어 있습니다.
 """
+import hashlib
 import logging
 import os
 import subprocess
 import sys
 import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from queue import Queue
 
-from flask import Blueprint, render_template, request, current_app, jsonify
+from flask import Blueprint, render_template, request, current_app, jsonify, make_response
+
+from flask_socketio import join_room
 
 from app import socketio
-from app.db import get_db
+from app.db import get_db, get_writer, write_transaction
 from app.filesync import (
     DEFAULT_RETENTION,
     DEFAULT_RETENTION_MODE,
@@ -27,12 +31,86 @@ from app.filesync import (
 )
 
 # 전역 동기화 관리자 상태 (config_id -> {manager, thread})
+# 요청 스레드가 동시에 읽고 지우므로, 조회는 get() 한 번, 제거는 pop()으로 원자적으로 처리한다.
 sync_managers = {}
+# sync_managers 변경 시 증가하는 버전. 시스템 상태 캐시 무효화에 사용한다.
+_sync_version = 0
+# 실행 중인 관리자 집합. 시스템 상태가 sync_managers를 순회하지 않고 크기만 읽는다.
+# (재시작 시 같은 config_id의 이전 스레드가 늦게 끝나도 새 관리자를 지우지 않도록 관리자 객체로 관리)
+_active_managers = set()
+
+# 헤더 시스템 상태 캐시. 초 단위 출력이므로 같은 초/같은 버전이면 재계산하지 않는다.
+_status_cache = {'key': None, 'val': None}
+_status_cache_lock = threading.Lock()
+
+# index()용 sync_configs 목록 캐시 (정규화된 dict 리스트). 설정/활성 상태 변경 시 비운다.
+_configs_cache = {'rows': None, 'by_id': None, 'version': 0}
+# 무효화와 캐시 채우기를 직렬화한다. version은 무효화마다 증가하며, 조회 도중 무효화가
+# 있었으면(조회 전과 version이 다르면) 그 결과를 캐시에 넣지 않는다.
+_configs_cache_lock = threading.Lock()
+
+# 렌더링 결과가 입력에 좌우되지 않는 부분 템플릿의 HTML 캐시 (템플릿 이름 -> 문자열)
+_static_partials = {}
+
+# 중지된 관리자 스레드를 요청 스레드 대신 기다려 주는 reaper (지연 기동)
+_reap_queue = Queue()
+_reaper_lock = threading.Lock()
+_reaper_thread = None
+# 설정 저장에 따른 재시작을 요청 밖에서 순서대로 처리하는 단일 작업자
+_restart_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="filesync-restart")
+# 대기 중인 재시작의 토큰 {config_id: object}. 중지/삭제/다음 저장이 토큰을 지우거나 바꾸면
+# 이미 큐에 들어간 재시작은 관리자를 띄우지 않는다. (_sync_lock으로 보호)
+_restart_tokens = {}
+
+# sync_managers 변경(등록/제거)과 전체 순회를 직렬화하는 잠금.
+# 단일 키 조회(get)는 잠금 없이 처리한다.
+_sync_lock = threading.Lock()
+
+# 자주 실행되는 SQL. 같은 문자열을 재사용해 sqlite3 문장 캐시가 재파싱을 건너뛰게 한다.
+SQL_SELECT_CONFIGS = 'SELECT * FROM sync_configs ORDER BY id'
+SQL_SELECT_ACTIVE_CONFIGS = 'SELECT * FROM sync_configs WHERE is_active = 1'
+SQL_UPDATE_ACTIVE_ON = 'UPDATE sync_configs SET is_active = 1 WHERE id = ?'
+SQL_UPDATE_ACTIVE_OFF = 'UPDATE sync_configs SET is_active = 0 WHERE id = ?'
+SQL_UPDATE_CONFIG = """
+    UPDATE sync_configs 
+    SET name=?, source_path=?, replica_path=?, pattern=?, interval=?, retention=?, retention_mode=?
+    WHERE id=?
+"""
+SQL_INSERT_CONFIG = """
+    INSERT INTO sync_configs (name, source_path, replica_path, pattern, interval, retention, retention_mode)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_DELETE_CONFIG = 'DELETE FROM sync_configs WHERE id = ?'
 
 DEFAULT_SOURCE_PATH = ''
 DEFAULT_REPLICA_PATH = ''
 logger = logging.getLogger(__name__)
 
+RETENTION_MODES = frozenset(("days", "count", "sync"))
+# retention 값을 찾을 컬럼 순서 (구 스키마의 retention_files/retention_days 포함)
+_RETENTION_KEYS_COUNT = ('retention', 'retention_files', 'retention_days')
+_RETENTION_KEYS_DAYS = ('retention', 'retention_days', 'retention_files')
+# 서버 종료/재시작 시 모든 작업 스레드의 종료를 기다리는 전체 시간(초)
+SHUTDOWN_JOIN_SECONDS = 2.0
+# 기동 시 자동 재개를 병렬로 처리할 최대 스레드 수 (경로 검증의 stat 대기를 겹치기 위함)
+RESUME_MAX_WORKERS = 16
+# run.py가 기록하는 PID 파일 경로 (프로세스 환경에서 한 번만 읽음)
+PID_FILE = os.environ.get('FILESYNC_PID_FILE')
+
+
+# 초 단위로 재사용하는 UTC ISO 시각 문자열 [epoch 초, 문자열]
+_iso_cache = [0, '']
+
+
+def _cached_iso():
+    """현재 UTC 시각의 ISO 문자열. 같은 초 안의 호출은 캐시된 문자열을 공유합니다."""
+    now = int(time.time())
+    cache = _iso_cache
+    if cache[0] != now:
+        cache[1] = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(now))
+        cache[0] = now
+    return cache[1]
+
 
 def _default_status(details="Sync stopped"):
     return {
@@ -41,14 +119,15 @@ def _default_status(details="Sync stopped"):
         'progress_percent': 0,
         'details': details,
         'last_sync_time': '',
-        'updated_at': datetime.utcnow().isoformat()
+        'updated_at': _cached_iso()
     }
 
 
 def _get_status_context(config_id, details=None):
     """특정 설정 ID에 대한 상태를 반환합니다."""
-    if config_id in sync_managers:
-        manager = sync_managers[config_id]['manager']
+    entry = sync_managers.get(config_id)
+    if entry is not None:
+        manager = entry['manager']
         return manager.running, manager.get_status()
     
     message = details if details else "Sync stopped"
@@ -63,11 +142,64 @@ def _status_payload(config_id, is_running, status):
     }
 
 
+def _wants_json():
+    """HTML만 요청하지 않는 한 JSON으로 응답할지 판별합니다.
+
+    폴링마다 MIMEAccept를 파싱하지 않도록 Accept 헤더 문자열만 확인합니다.
+    (기존 품질값 비교와 같이 동률·와일드카드·헤더 없음은 JSON으로 처리)
+    """
+    accept = request.headers.get('Accept', '')
+    return 'text/html' not in accept or 'application/json' in accept
+
+
+def _status_etag(*parts):
+    """상태 값으로 만든 짧은 ETag (updated_at처럼 매번 바뀌는 값은 호출 측에서 제외)."""
+    return hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+
+
+def _render_static_partial(template_name):
+    """상태 값을 쓰지 않는 부분 템플릿(값은 Alpine이 JSON으로 채움)을 한 번만 렌더링합니다."""
+    html = _static_partials.get(template_name)
+    if html is None:
+        html = _static_partials.setdefault(template_name, render_template(template_name))
+    return html
+
+
+_STOPPED_CID = '__CID__'
+_STOPPED_UPDATED_AT = '__UPDATED_AT__'
+
+
+def _render_stopped_status(config_id, updated_at):
+    """중지된 작업의 상태 패널. 한 번 렌더링한 HTML에 config_id와 시각만 치환합니다."""
+    html = _static_partials.get('stopped-status')
+    if html is None:
+        status = _default_status()
+        status['updated_at'] = _STOPPED_UPDATED_AT
+        html = _static_partials.setdefault('stopped-status', render_template(
+            'partials/sync_status.html', is_running=False, status=status, config_id=_STOPPED_CID
+        ))
+    return html.replace(_STOPPED_CID, str(config_id)).replace(_STOPPED_UPDATED_AT, updated_at)
+
+
+def _conditional_response(etag, build_response):
+    """If-None-Match가 ETag와 같으면 렌더링 없이 304를, 아니면 ETag를 붙인 응답을 반환합니다."""
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+    else:
+        response = make_response(build_response())
+    response.set_etag(etag)
+    # 캐시는 하되 매번 ETag로 재검증하게 한다.
+    response.cache_control.no_cache = True
+    return response
+
+
 def _status_response(config_id, is_running, status):
-    wants_json = request.accept_mimetypes["application/json"] >= request.accept_mimetypes["text/html"]
+    wants_json = _wants_json()
     if wants_json:
         return jsonify(_status_payload(config_id, is_running, status))
-    return render_template("partials/sync_status.html", is_running=is_running, status=status, config_id=config_id)
+    # 상태 패널은 request/g 등 Flask 컨텍스트 값을 쓰지 않으므로 컴파일된 템플릿을 직접 렌더링한다.
+    template = current_app.jinja_env.get_template("partials/sync_status.html")
+    return template.render(is_running=is_running, status=status, config_id=config_id)
 
 
 def _resolve_retention_value(config: dict, retention_mode: str) -> int:
@@ -75,36 +207,147 @@ def _resolve_retention_value(config: dict, retention_mode: str) -> int:
     if retention_mode == "sync":
         return 0
 
-    if retention_mode == "count":
-        candidates = [
-            config.get('retention'),
-            config.get('retention_files'),
-            config.get('retention_days'),
-            DEFAULT_RETENTION,
-        ]
-    else:
-        candidates = [
-            config.get('retention'),
-            config.get('retention_days'),
-            config.get('retention_files'),
-            DEFAULT_RETENTION,
-        ]
-
-    for candidate in candidates:
+    keys = _RETENTION_KEYS_COUNT if retention_mode == "count" else _RETENTION_KEYS_DAYS
+    for key in keys:
+        candidate = config.get(key)
+        if candidate is None:
+            continue
         try:
-            value = int(candidate)
-            return max(value, 0)
+            return max(int(candidate), 0)
         except (TypeError, ValueError):
             continue
 
-    return 0
+    return max(DEFAULT_RETENTION, 0)
+
+
+class ConfigView:
+    """캐시된 설정 dict 위에 요청별 값(is_running, status)을 덧씌우는 읽기 전용 뷰.
+
+    index()가 설정마다 dict를 복사하지 않도록 한다. 템플릿의 config.name 같은 접근은
+    Jinja가 __getitem__으로 처리한다.
+    """
+
+    __slots__ = ('_base', '_overlay')
+
+    def __init__(self, base, **overlay):
+        self._base = base
+        self._overlay = overlay
+
+    def __getitem__(self, key):
+        overlay = self._overlay
+        if key in overlay:
+            return overlay[key]
+        return self._base[key]
+
+    def __contains__(self, key):
+        return key in self._overlay or key in self._base
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
+def _invalidate_configs_cache():
+    with _configs_cache_lock:
+        _configs_cache['version'] += 1
+        _configs_cache['rows'] = None
+        _configs_cache['by_id'] = None
+
+
+def _load_configs():
+    """정규화된 설정 목록을 반환합니다. 캐시가 비어 있을 때만 DB를 조회합니다."""
+    with _configs_cache_lock:
+        rows = _configs_cache['rows']
+        if rows is not None:
+            return rows
+        version = _configs_cache['version']
+
+    db = get_db()
+    config_rows = db.execute(SQL_SELECT_CONFIGS).fetchall()
+
+    rows = [_normalize_config(row) for row in config_rows]
+
+    with _configs_cache_lock:
+        # 조회하는 동안 저장/삭제가 커밋되었다면 이 결과는 이전 값일 수 있으므로 캐시하지 않는다.
+        if _configs_cache['version'] == version:
+            _configs_cache['by_id'] = {config['id']: config for config in rows}
+            _configs_cache['rows'] = rows
+    return rows
+
+
+def _get_config(config_id):
+    """정규화된 단일 설정을 캐시에서 찾습니다 (없으면 None)."""
+    by_id = _configs_cache['by_id']
+    if by_id is None:
+        by_id = {config['id']: config for config in _load_configs()}
+    return by_id.get(config_id)
+
+
+def _bump_sync_version():
+    global _sync_version
+    with _status_cache_lock:
+        _sync_version += 1
+
+
+def _set_manager_active(manager, active):
+    """실행 중 관리자 집합을 갱신하고, 바뀌었으면 시스템 상태 캐시를 무효화합니다."""
+    global _sync_version
+    with _status_cache_lock:
+        if active:
+            _active_managers.add(manager)
+        elif manager in _active_managers:
+            _active_managers.discard(manager)
+        else:
+            return
+        _sync_version += 1
+
+
+def _run_manager(manager):
+    """관리자 스레드 본문. 스스로 종료한 경우에도 활성 집합에서 빠지도록 한다."""
+    try:
+        manager.run()
+    finally:
+        _set_manager_active(manager, False)
+
+
+def _normalize_config(raw):
+    """DB 행(또는 dict)을 기본값/검증이 적용된 설정 dict로 변환합니다.
+
+    원본의 다른 컬럼(구 스키마의 retention_days 등)은 그대로 유지합니다.
+    """
+    config = dict(raw)
+    config['source_path'] = config.get('source_path') or DEFAULT_SOURCE_PATH
+    config['replica_path'] = config.get('replica_path') or DEFAULT_REPLICA_PATH
+    retention_mode = config.get('retention_mode')
+    config['retention_mode'] = retention_mode if retention_mode in RETENTION_MODES else DEFAULT_RETENTION_MODE
+    config['retention'] = _resolve_retention_value(config, config['retention_mode'])
+    try:
+        interval_value = int(config.get('interval') or 0)
+    except (TypeError, ValueError):
+        interval_value = DEFAULT_SCAN_INTERVAL_MINUTES
+    if interval_value <= 0:
+        interval_value = DEFAULT_SCAN_INTERVAL_MINUTES
+    config['interval'] = interval_value
+    return config
 
 
 def _build_system_status():
+    """헤더에 노출할 전체 시스템 상태 정보를 반환합니다 (1초 단위 메모이즈)."""
+    key = (int(time.monotonic()), _sync_version)
+    with _status_cache_lock:
+        if _status_cache['key'] == key:
+            return _status_cache['val']
+        status = _compute_system_status()
+        _status_cache['key'] = key
+        _status_cache['val'] = status
+        return status
+
+
+def _compute_system_status():
     """헤더에 노출할 전체 시스템 상태 정보를 계산합니다."""
-    active_count = sum(
-        1 for entry in sync_managers.values() if entry['manager'].running
-    )
+    active_count = len(_active_managers)
     total_configs = len(sync_managers)
 
     if active_count > 0:
@@ -126,13 +369,18 @@ def _build_system_status():
         'detail': detail,
         'active_count': active_count,
         'total_configs': total_configs,
-        'checked_at': datetime.utcnow().strftime("%H:%M:%S"),
+        'checked_at': _cached_iso()[11:19],
     }
 
 
+def _config_room(config_id):
+    """해당 설정의 sync_update를 구독하는 클라이언트 방 이름."""
+    return f"cfg:{config_id}"
+
+
 def _emit_status_event(config_id, is_running, status):
     try:
-        socketio.emit("sync_update", _status_payload(config_id, is_running, status))
+        socketio.emit("sync_update", _status_payload(config_id, is_running, status), to=_config_room(config_id))
     except Exception:
         logger.exception("Failed to emit sync_update for config %s", config_id)
 
@@ -147,35 +395,40 @@ def _emit_system_status(target_sid=None):
             socketio.emit("system_status", payload)
     except Exception:
         logger.exception("Failed to emit system_status")
-def _start_sync_manager(config_row, resume=False):
+
+
+def _sync_manager_ids():
+    """현재 등록된 config_id 목록의 스냅샷."""
+    with _sync_lock:
+        return list(sync_managers)
+
+
+def _is_entry_running(entry):
+    """등록된 관리자가 실행 중(또는 스레드가 막 기동되어 run() 진입 전)인지 여부."""
+    if entry is None:
+        return False
+    return entry['manager'].running or entry['thread'].is_alive()
+
+
+def _start_sync_manager(config_row, resume=False, update_db=True, restart_token=None):
     """
     config_row 정보를 기반으로 FileSyncManager를 기동합니다.
     resume=True일 경우 서버 재기동 후 자동 재시작 상황을 의미합니다.
+    update_db=False이면 성공 시 실행 상태 플래그를 기록하지 않습니다 (호출 측에서 관리).
+    restart_token이 주어지면 등록 직전(_sync_lock 안)에 그 재시작이 아직 유효한지 확인하고,
+    취소되었으면 관리자를 만들지 않고 (False, None)을 반환합니다.
     """
     config_id = config_row['id']
     
     # 이미 실행 중인지 확인
-    if config_id in sync_managers:
-        manager = sync_managers[config_id]['manager']
-        if manager.running:
-            return True, None
+    if _is_entry_running(sync_managers.get(config_id)):
+        return True, None
 
     started_new = False
 
-    db = get_db()
-    config_data = dict(config_row)
-    source_path = config_data.get('source_path') or DEFAULT_SOURCE_PATH
-    replica_path = config_data.get('replica_path') or DEFAULT_REPLICA_PATH
-    retention_mode = config_data.get('retention_mode') or DEFAULT_RETENTION_MODE
-    retention_mode = retention_mode if retention_mode in ("days", "count", "sync") else DEFAULT_RETENTION_MODE
-    retention_value = _resolve_retention_value(config_data, retention_mode)
-    interval_raw = config_data.get('interval')
-    try:
-        interval_minutes = int(interval_raw) if interval_raw is not None else DEFAULT_SCAN_INTERVAL_MINUTES
-    except (TypeError, ValueError):
-        interval_minutes = DEFAULT_SCAN_INTERVAL_MINUTES
-    if interval_minutes <= 0:
-        interval_minutes = DEFAULT_SCAN_INTERVAL_MINUTES
+    config_data = _normalize_config(config_row)
+    source_path = config_data['source_path']
+    replica_path = config_data['replica_path']
 
     try:
         # 경로 사전 검증: 존재하지 않으면 즉시 실패 반환
@@ -188,41 +441,48 @@ def _start_sync_manager(config_row, resume=False):
             source=Path(source_path),
             destination=Path(replica_path),
             pattern=config_data['pattern'],
-            retention=retention_value,
-            retention_mode=retention_mode,
-            scan_interval_minutes=interval_minutes,
+            retention=config_data['retention'],
+            retention_mode=config_data['retention_mode'],
+            scan_interval_minutes=config_data['interval'],
         )
 
-        if not logging.getLogger().handlers:
-            logging.basicConfig(
-                level=logging.INFO,
-                format="%(asctime)s - %(levelname)s - %(message)s",
+        # 이중 확인: 잠금 없이 본 뒤 잠금 안에서 다시 확인해, 동시에 들어온 시작 요청이
+        # 같은 설정의 관리자를 두 번 띄우지 않게 한다.
+        with _sync_lock:
+            if restart_token is not None:
+                if _restart_tokens.get(config_id) is not restart_token:
+                    return False, None
+                del _restart_tokens[config_id]
+            if _is_entry_running(sync_managers.get(config_id)):
+                return True, None
+
+            manager_holder = {}
+
+            def status_callback(status):
+                manager_instance = manager_holder.get('manager')
+                is_running = bool(manager_instance and manager_instance.running)
+                _emit_status_event(config_id, is_running, status or {})
+
+            manager = FileSyncManager(
+                sync_config,
+                status_callback=status_callback,
+                config_id=config_id,
             )
-
-        manager_holder = {}
-
-        def status_callback(status):
-            manager_instance = manager_holder.get('manager')
-            is_running = bool(manager_instance and manager_instance.running)
-            _emit_status_event(config_id, is_running, status or {})
-
-        manager = FileSyncManager(
-            sync_config,
-            status_callback=status_callback,
-            config_id=config_id,
-        )
-        manager_holder['manager'] = manager
-        thread = threading.Thread(target=manager.run, daemon=True)
-        thread.start()
-
-        sync_managers[config_id] = {
-            'manager': manager,
-            'thread': thread
-        }
-        started_new = True
-
-        db.execute('UPDATE sync_configs SET is_active = 1 WHERE id = ?', (config_id,))
-        db.commit()
+            manager_holder['manager'] = manager
+            _set_manager_active(manager, True)
+            thread = threading.Thread(target=_run_manager, args=(manager,), daemon=True)
+            thread.start()
+
+            sync_managers[config_id] = {
+                'manager': manager,
+                'thread': thread
+            }
+            _bump_sync_version()
+            started_new = True
+
+        # 재개 대상은 is_active = 1인 행에서 골랐으므로 다시 기록할 필요가 없다.
+        if update_db and not resume:
+            get_writer().submit(SQL_UPDATE_ACTIVE_ON, (config_id,), on_done=_invalidate_configs_cache)
 
         if resume:
             current_app.logger.info(f"Resumed file sync automatically for config {config_id} after restart.")
@@ -231,38 +491,140 @@ def _start_sync_manager(config_row, resume=False):
         return True, None
     except Exception as exc:
         current_app.logger.error(f"Failed to start sync for config {config_id}: {exc}")
-        db.execute('UPDATE sync_configs SET is_active = 0 WHERE id = ?', (config_id,))
-        db.commit()
+        get_writer().submit(SQL_UPDATE_ACTIVE_OFF, (config_id,), on_done=_invalidate_configs_cache)
         return False, str(exc)
 
 
-def _stop_sync_manager(config_id, update_db=True):
+def _queue_restart(config_id):
+    """설정 변경에 따른 재시작을 큐에 넣습니다. 같은 설정의 이전 재시작 요청은 무효가 됩니다."""
+    token = object()
+    with _sync_lock:
+        _restart_tokens[config_id] = token
+    app = current_app._get_current_object()
+    _restart_executor.submit(_restart_sync_manager, app, config_id, token)
+
+
+def _restart_pending(config_id):
+    with _sync_lock:
+        return config_id in _restart_tokens
+
+
+def _restart_sync_manager(app, config_id, token):
+    """설정 변경 후 실행 중이던 작업을 재시작합니다 (_restart_executor에서 실행).
+
+    큐에 넣은 뒤 중지/삭제되었거나 더 최근 저장이 재시작을 다시 요청했으면 시작하지 않습니다.
+    """
+    with app.app_context():
+        # 재시작 전후 모두 is_active = 1이므로 성공하면 플래그를 다시 쓰지 않는다.
+        _stop_sync_manager(config_id, update_db=False, wait=True, cancel_restart=False)
+        # 저장 이후의 최신 설정으로 시작한다 (삭제되었으면 None).
+        config = _get_config(config_id)
+        if config is None:
+            with _sync_lock:
+                if _restart_tokens.get(config_id) is token:
+                    del _restart_tokens[config_id]
+            return
+        restarted, error_message = _start_sync_manager(config, update_db=False, restart_token=token)
+        if restarted:
+            return
+        if error_message is None:
+            # 시작 직전에 재시작이 취소됨 (중지/삭제/이후 저장)
+            return
+        get_writer().submit(SQL_UPDATE_ACTIVE_OFF, (config_id,), on_done=_invalidate_configs_cache)
+        restart_error = error_message or "재시작 실패"
+        app.logger.error(f"Config {config_id} 재시작 실패: {restart_error}")
+        _emit_status_event(config_id, False, _default_status(f"설정 저장 후 재시작 실패: {restart_error}"))
+
+
+def _reaper_loop():
+    while True:
+        thread = _reap_queue.get()
+        thread.join()
+
+
+def _reap_later(thread):
+    """중지 신호를 보낸 관리자 스레드의 종료 대기를 reaper 스레드에 맡깁니다."""
+    global _reaper_thread
+    with _reaper_lock:
+        if _reaper_thread is None:
+            _reaper_thread = threading.Thread(target=_reaper_loop, name="filesync-reaper", daemon=True)
+            _reaper_thread.start()
+    _reap_queue.put(thread)
+
+
+def _stop_sync_manager(config_id, update_db=True, wait=False, cancel_restart=True):
     """특정 설정 ID의 동기화 작업을 중지합니다.
 
+    대기 중인 설정 변경 재시작도 함께 취소합니다 (재시작 작업 자신은 cancel_restart=False).
     update_db=False이면 실행 상태 플래그를 유지한 채로 스레드만 종료합니다.
+    wait=False이면 스레드 종료를 기다리지 않고 reaper에 맡긴 뒤 바로 반환합니다.
+    설정 변경 후 재시작처럼 이전 작업이 정리되어야 하는 경우 wait=True로 호출합니다.
+    중지한 작업의 스레드를 반환합니다 (없으면 None).
     """
     stopped = False
-    if config_id in sync_managers:
-        entry = sync_managers[config_id]
+    thread = None
+    # 목록에서 먼저 빼서, 중지 중인 관리자를 다른 요청이 보지 않게 한다.
+    with _sync_lock:
+        entry = sync_managers.pop(config_id, None)
+        if cancel_restart:
+            _restart_tokens.pop(config_id, None)
+    if entry is not None:
         manager = entry['manager']
         thread = entry['thread']
         
         manager.stop()
+        _set_manager_active(manager, False)
         _emit_status_event(config_id, False, manager.get_status())
         if thread.is_alive():
-            thread.join(timeout=2.0)
+            if wait:
+                thread.join(timeout=2.0)
+            else:
+                _reap_later(thread)
             
-        del sync_managers[config_id]
+        _bump_sync_version()
         stopped = True
         
         # DB 상태 업데이트
         if update_db:
-            db = get_db()
-            db.execute('UPDATE sync_configs SET is_active = 0 WHERE id = ?', (config_id,))
-            db.commit()
+            get_writer().submit(SQL_UPDATE_ACTIVE_OFF, (config_id,), on_done=_invalidate_configs_cache)
 
     if stopped:
         _emit_system_status()
+    return thread
+
+
+def _remove_pid_file():
+    """run.py가 만든 PID 파일을 지웁니다 (존재 확인 없이 unlink 한 번)."""
+    if not PID_FILE:
+        return
+    try:
+        os.unlink(PID_FILE)
+    except OSError:
+        return
+    current_app.logger.info("PID file removed: %s", PID_FILE)
+
+
+def _stop_all_sync_managers():
+    """모든 작업에 중지 신호만 보내고(기다리지 않음) 해당 스레드 목록을 반환합니다.
+
+    실행 상태 플래그는 유지하므로 다음 기동 시 자동 재개됩니다.
+    """
+    threads = []
+    for config_id in _sync_manager_ids():
+        thread = _stop_sync_manager(config_id, update_db=False)
+        if thread is not None:
+            threads.append(thread)
+    return threads
+
+
+def _join_threads(threads, timeout):
+    """전체 timeout 안에서 스레드들의 종료를 기다립니다 (스레드마다 따로 기다리지 않음)."""
+    deadline = time.monotonic() + timeout
+    for thread in threads:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        thread.join(remaining)
 
 
 # 메인 블루프린트 정의
@@ -275,33 +637,11 @@ def index():
     """
     메인 페이지 - 파일 동기화 설정 및 상태 페이지
     """
-    db = get_db()
-    # 모든 설정을 가져옴
-    config_rows = db.execute('SELECT * FROM sync_configs ORDER BY id').fetchall()
-    
     configs = []
-    for row in config_rows:
-        config = dict(row)
-        config['source_path'] = config.get('source_path') or DEFAULT_SOURCE_PATH
-        config['replica_path'] = config.get('replica_path') or DEFAULT_REPLICA_PATH
-        config['retention_mode'] = config.get('retention_mode') or DEFAULT_RETENTION_MODE
-        if config['retention_mode'] not in ("days", "count", "sync"):
-            config['retention_mode'] = DEFAULT_RETENTION_MODE
-        config['retention'] = _resolve_retention_value(config, config['retention_mode'])
-        try:
-            interval_value = int(config.get('interval') or 0)
-        except (TypeError, ValueError):
-            interval_value = DEFAULT_SCAN_INTERVAL_MINUTES
-        if interval_value <= 0:
-            interval_value = DEFAULT_SCAN_INTERVAL_MINUTES
-        config['interval'] = interval_value
-        
-        # 각 설정에 대한 현재 상태 주입
-        is_running, status = _get_status_context(config['id'])
-        config['is_running'] = is_running
-        config['status'] = status
-        
-        configs.append(config)
+    # 모든 설정을 가져옴 (캐시된 dict는 공유되므로 뷰로 현재 상태를 덧씌움)
+    for cached in _load_configs():
+        is_running, status = _get_status_context(cached['id'])
+        configs.append(ConfigView(cached, is_running=is_running, status=status))
 
     # 설정이 하나도 없으면 기본 빈 설정 하나 추가 (UI에서 보여주기 위함)
     if not configs:
@@ -338,7 +678,7 @@ def update_sync_config():
     if interval <= 0:
         interval = DEFAULT_SCAN_INTERVAL_MINUTES
     retention_mode = request.form.get('retention_mode', DEFAULT_RETENTION_MODE)
-    retention_mode = retention_mode if retention_mode in ("days", "count", "sync") else DEFAULT_RETENTION_MODE
+    retention_mode = retention_mode if retention_mode in RETENTION_MODES else DEFAULT_RETENTION_MODE
     retention_raw = request.form.get('retention')
     try:
         retention = int(retention_raw) if retention_raw is not None else DEFAULT_RETENTION
@@ -371,52 +711,43 @@ def update_sync_config():
     was_running = False
     if config_id:
         config_id = int(config_id)
-        if config_id in sync_managers:
-            manager_entry = sync_managers[config_id]
-            manager = manager_entry['manager']
-            was_running = manager.running
-        db.execute("""
-            UPDATE sync_configs 
-            SET name=?, source_path=?, replica_path=?, pattern=?, interval=?, retention=?, retention_mode=?
-            WHERE id=?
-        """, (name, source_path, replica_path, pattern, interval, retention, retention_mode, config_id))
+        manager_entry = sync_managers.get(config_id)
+        if manager_entry is not None:
+            was_running = manager_entry['manager'].running
+        if not was_running:
+            # 앞선 저장의 재시작이 아직 대기 중이면 이번 저장으로 다시 요청한다.
+            was_running = _restart_pending(config_id)
+        with write_transaction(db):
+            db.execute(SQL_UPDATE_CONFIG, (name, source_path, replica_path, pattern, interval, retention, retention_mode, config_id))
         new_id = config_id
     else:
-        cursor = db.execute("""
-            INSERT INTO sync_configs (name, source_path, replica_path, pattern, interval, retention, retention_mode)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (name, source_path, replica_path, pattern, interval, retention, retention_mode))
+        with write_transaction(db):
+            cursor = db.execute(SQL_INSERT_CONFIG, (name, source_path, replica_path, pattern, interval, retention, retention_mode))
         new_id = cursor.lastrowid
-        
-    db.commit()
+
+    _invalidate_configs_cache()
     
-    # 업데이트된 설정 다시 조회
-    config_row = db.execute('SELECT * FROM sync_configs WHERE id = ?', (new_id,)).fetchone()
-    config = dict(config_row)
-    config['retention_mode'] = config.get('retention_mode') or DEFAULT_RETENTION_MODE
-    if config['retention_mode'] not in ("days", "count", "sync"):
-        config['retention_mode'] = DEFAULT_RETENTION_MODE
-    config['retention'] = _resolve_retention_value(config, config['retention_mode'])
-    try:
-        interval_value = int(config.get('interval') or 0)
-    except (TypeError, ValueError):
-        interval_value = DEFAULT_SCAN_INTERVAL_MINUTES
-    if interval_value <= 0:
-        interval_value = DEFAULT_SCAN_INTERVAL_MINUTES
-    config['interval'] = interval_value
+    # 저장한 값은 위에서 이미 정규화했으므로 다시 조회하지 않고 그대로 사용
+    config = {
+        'id': new_id,
+        'name': name,
+        'source_path': source_path,
+        'replica_path': replica_path,
+        'pattern': pattern,
+        'interval': interval,
+        'retention': retention,
+        'retention_mode': retention_mode,
+    }
 
-    restart_error = None
     if was_running:
-        _stop_sync_manager(new_id)
-        restarted, error_message = _start_sync_manager(config_row)
-        if not restarted:
-            restart_error = error_message or "재시작 실패"
-            current_app.logger.error(f"Config {new_id} 재시작 실패: {restart_error}")
-    
+        # 이전 스레드 종료 대기(최대 2초)와 경로 검증은 응답 뒤에 처리하고,
+        # 결과는 sync_update 이벤트로 전달한다.
+        _queue_restart(new_id)
+
     # 상태 정보 주입
     is_running, status = _get_status_context(config['id'])
-    if restart_error:
-        status['details'] = f"설정 저장 후 재시작 실패: {restart_error}"
+    if was_running:
+        status['details'] = "변경된 설정으로 재시작 중..."
     config['is_running'] = is_running
     config['status'] = status
     
@@ -453,8 +784,9 @@ def delete_sync_config(config_id):
     _stop_sync_manager(config_id)
     
     db = get_db()
-    db.execute('DELETE FROM sync_configs WHERE id = ?', (config_id,))
-    db.commit()
+    with write_transaction(db):
+        db.execute(SQL_DELETE_CONFIG, (config_id,))
+    _invalidate_configs_cache()
     
     return ""  # 빈 응답을 보내면 HTMX가 요소를 DOM에서 제거함
 
@@ -465,7 +797,17 @@ def get_sync_status(config_id):
     [HTMX] 동기화 상태 폴링
     """
     is_running, status = _get_status_context(config_id)
-    return _status_response(config_id, is_running, status)
+    wants_json = _wants_json()
+    etag = _status_etag(
+        config_id,
+        is_running,
+        wants_json,
+        sorted((key, value) for key, value in status.items() if key != 'updated_at'),
+    )
+    if config_id not in sync_managers and not wants_json:
+        # 대부분의 폴링은 중지된 작업이므로 미리 렌더링한 HTML을 재사용한다.
+        return _conditional_response(etag, lambda: _render_stopped_status(config_id, status['updated_at']))
+    return _conditional_response(etag, lambda: _status_response(config_id, is_running, status))
 
 
 @main.route('/filesync/status/<int:config_id>.json')
@@ -482,8 +824,7 @@ def start_sync(config_id):
     """
     [HTMX] 동기화 시작
     """
-    db = get_db()
-    config_row = db.execute('SELECT * FROM sync_configs WHERE id = ?', (config_id,)).fetchone()
+    config_row = _get_config(config_id)
     
     if not config_row:
         is_running, status = _get_status_context(config_id, details="설정을 찾을 수 없습니다.")
@@ -517,22 +858,19 @@ def shutdown_server():
     """
     [HTMX] 서버 종료
     """
-    # 모든 동기화 작업 중지
-    for config_id in list(sync_managers.keys()):
-        _stop_sync_manager(config_id, update_db=False)
+    # 모든 동기화 작업에 중지 신호 (종료 대기는 응답 후 백그라운드에서)
+    threads = _stop_all_sync_managers()
 
     # PID 파일 정리
-    pid_target = os.environ.get('FILESYNC_PID_FILE')
-    if pid_target and os.path.exists(pid_target):
-        try:
-            os.unlink(pid_target)
-            current_app.logger.info("PID file removed: %s", pid_target)
-        except OSError:
-            pass
+    _remove_pid_file()
 
     # 서버 종료를 별도 스레드에서 실행 (응답을 먼저 보내기 위해)
+    writer = get_writer()
+
     def delayed_shutdown():
         time.sleep(0.5)  # 클라이언트 응답을 위한 약간의 지연
+        _join_threads(threads, SHUTDOWN_JOIN_SECONDS)
+        writer.flush()  # 대기 중인 DB 쓰기를 반영한 뒤 종료
         os._exit(0)
 
     threading.Thread(target=delayed_shutdown, daemon=True).start()
@@ -545,28 +883,27 @@ def restart_server():
     """
     [HTMX] 서버 재시작
     """
-    # 모든 동기화 작업 중지
-    for config_id in list(sync_managers.keys()):
-        _stop_sync_manager(config_id, update_db=False)
+    # 모든 동기화 작업에 중지 신호 (종료 대기는 응답 후 백그라운드에서)
+    threads = _stop_all_sync_managers()
 
     # PID 파일 정리 (선택적)
-    pid_target = os.environ.get('FILESYNC_PID_FILE')
-    if pid_target and os.path.exists(pid_target):
-        try:
-            os.unlink(pid_target)
-            current_app.logger.info("PID file removed: %s", pid_target)
-        except OSError:
-            pass
+    _remove_pid_file()
 
     # 서버 재시작: 동일한 파이썬 인터프리터로 현재 프로세스를 새로 띄우고 종료
+    writer = get_writer()
+
     def delayed_restart():
         time.sleep(0.5)
+        _join_threads(threads, SHUTDOWN_JOIN_SECONDS)
+        writer.flush()
         try:
             python = sys.executable
             args = [python] + sys.argv
+            # close_fds=True로 리슨 소켓을 넘기지 않는다. (werkzeug는 서버 소켓을 상속 가능하게 열어
+            # os.execv로 이미지를 교체하면 새 프로세스가 같은 포트에 bind하지 못한다)
             subprocess.Popen(args, close_fds=True)
         except Exception:
-            current_app.logger.exception("Failed to spawn process for restart.")
+            logger.exception("Failed to spawn process for restart.")
         finally:
             os._exit(0)
 
@@ -581,7 +918,12 @@ def server_status():
     [HTMX] 헤더 상태 뱃지를 위한 시스템 상태 엔드포인트
     """
     status = _build_system_status()
-    return render_template('partials/server_status_badge.html', status=status)
+    etag = _status_etag(
+        status['state'], status['detail'], status['active_count'], status['total_configs']
+    )
+    return _conditional_response(
+        etag, lambda: _render_static_partial('partials/server_status_badge.html')
+    )
 
 
 @main.route('/server/status.json')
@@ -596,29 +938,33 @@ def server_status_json():
 def resume_active_syncs():
     """
     앱 재기동 후 이전에 실행 중이던 동기화를 자동 재개합니다.
+    create_app()에서 기동 시 한 번 호출됩니다.
     """
     db = get_db()
     # 활성화된 모든 설정 조회
-    config_rows = db.execute('SELECT * FROM sync_configs WHERE is_active = 1').fetchall()
+    config_rows = db.execute(SQL_SELECT_ACTIVE_CONFIGS).fetchall()
     
-    resumed = 0
-    for row in config_rows:
-        started, _ = _start_sync_manager(row, resume=True)
-        if started:
-            resumed += 1
+    if not config_rows:
+        return
+
+    app = current_app._get_current_object()
+
+    def resume_one(row):
+        with app.app_context():
+            started, _ = _start_sync_manager(row, resume=True)
+        return started
+
+    # 네트워크 경로의 검증(stat)이 느릴 수 있으므로 설정별 기동을 동시에 진행
+    with ThreadPoolExecutor(
+        max_workers=min(RESUME_MAX_WORKERS, len(config_rows)),
+        thread_name_prefix="filesync-resume",
+    ) as executor:
+        resumed = sum(1 for started in executor.map(resume_one, config_rows) if started)
     if resumed:
         logger.info("서버 기동 시 활성화 상태 작업 %s개 자동 재개", resumed)
         _emit_system_status()
 
 
-@main.before_app_request
-def resume_sync_if_needed():
-    """
-    첫 요청 이전에 재개 로직이 실행되지 않았다면 안전하게 한 번 더 호출합니다.
-    """
-    resume_active_syncs()
-
-
 @socketio.on("connect")
 def handle_socket_connect():
     """
@@ -633,3 +979,16 @@ def handle_system_status_request():
     클라이언트의 수동 요청에 따라 시스템 상태를 전달합니다.
     """
     _emit_system_status(target_sid=request.sid)
+
+
+@socketio.on("subscribe")
+def handle_subscribe(data=None):
+    """
+    클라이언트를 요청한 설정들의 방에 참여시켜 해당 설정의 상태 갱신만 받게 합니다.
+    """
+    config_ids = (data or {}).get('config_ids') or []
+    for config_id in config_ids:
+        try:
+            join_room(_config_room(int(config_id)))
+        except (TypeError, ValueError):
+            continue
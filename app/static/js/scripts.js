@@ -268,7 +268,13 @@ window.syncStatusPanel = (options) => {
                 this.details = '실시간 연결을 초기화할 수 없습니다.';
                 return;
             }
+            // 이 카드의 설정 방에 참여해 해당 설정의 sync_update만 받는다 (재연결 시 다시 참여).
+            const subscribe = () => socket.emit('subscribe', { config_ids: [this.configId] });
+            if (socket.connected) {
+                subscribe();
+            }
             socket.on('connect', () => {
+                subscribe();
                 this.refreshStatus();
             });
             socket.on('sync_update', (payload) => {
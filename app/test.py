@@ -15,7 +15,7 @@ def background_time_sender():
     server_socket_active가 False로 설정되면 루프를 빠져나와 전송을 중단합니다."""
     global server_socket_active
     while server_socket_active:
-        time.sleep(1)
+        socketio.sleep(1)  # async_mode에 맞는 대기 (eventlet/gevent에서도 OS 스레드를 막지 않음)
         timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
         socketio.emit('server_time', {'time': timestamp})
     print('Background time sender stopped.')
@@ -2,25 +2,40 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import fnmatch
+import re
+from functools import lru_cache
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, Optional
 
 DEFAULT_PATTERN = "*"
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_size(num_bytes: float) -> str:
-    units = ["B", "KB", "MB", "GB", "TB"]
-    value = float(num_bytes)
-    for unit in units:
-        if value < 1024 or unit == units[-1]:
-            return f"{value:.1f} {unit}"
-        value /= 1024
-    return f"{value:.1f} {units[-1]}"
+    """바이트 수를 1024 단위 문자열로 변환 (단위는 정수부의 비트 길이로 바로 고른다)."""
+    whole = int(num_bytes)
+    if whole < 1024:
+        return f"{float(num_bytes):.1f} B"
+    index = min((whole.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{num_bytes / (1 << (10 * index)):.1f} {_SIZE_UNITS[index]}"
+
 
+PROGRESS_BAR_WIDTH = 20
+# 기본 폭(20칸)에서 나올 수 있는 막대 21가지를 미리 만들어 둔다.
+_PROGRESS_BARS = tuple(
+    "█" * filled + " " * (PROGRESS_BAR_WIDTH - filled)
+    for filled in range(PROGRESS_BAR_WIDTH + 1)
+)
 
-def progress_bar(percent: int, width: int = 20) -> str:
+
+def progress_bar(percent: int, width: int = PROGRESS_BAR_WIDTH) -> str:
+    if width == PROGRESS_BAR_WIDTH and isinstance(percent, int) and 0 <= percent <= 100:
+        return f"[{_PROGRESS_BARS[percent * PROGRESS_BAR_WIDTH // 100]}] {percent}%"
     filled = int(width * percent / 100)
     bar = "█" * filled + " " * (width - filled)
     return f"[{bar}] {percent}%"
@@ -35,45 +50,129 @@ def parse_patterns(pattern_value: str) -> list[str]:
     return patterns or [DEFAULT_PATTERN]
 
 
+@lru_cache(maxsize=64)
+def _compile_pattern_tuple(patterns: tuple[str, ...]) -> Callable[[str], bool]:
+    if any(pattern == "*" for pattern in patterns):
+        return lambda file_name: True
+    union = "|".join(fnmatch.translate(pattern.casefold()) for pattern in patterns)
+    match = re.compile(union).match
+    return lambda file_name: match(file_name.casefold()) is not None
+
+
+def compile_patterns(patterns: list[str]) -> Callable[[str], bool]:
+    """패턴 목록을 한 번만 정규식으로 변환해 파일명 판별 함수로 반환 (대소문자 무시)."""
+    return _compile_pattern_tuple(tuple(patterns))
+
+
 def matches_patterns(file_name: str, patterns: list[str]) -> bool:
     """대소문자를 무시하고 파일명이 패턴 목록 중 하나와 일치하는지 확인."""
-    lowered_name = file_name.casefold()
-    for pattern in patterns:
-        if fnmatch.fnmatch(lowered_name, pattern.casefold()):
-            return True
-    return False
+    return compile_patterns(patterns)(file_name)
 
 
-def build_history_key(root: Path, file_path: Path) -> str:
-    try:
-        return file_path.relative_to(root).as_posix()
-    except ValueError:
-        return file_path.name
+def build_history_key(root: Path | str, file_path: Path | str) -> str:
+    """root 기준 posix 상대 경로. root 밖의 경로면 파일명만 사용한다.
+
+    relative_to 대신 문자열 접두사 비교로 처리해 Path 생성과 예외 비용이 없다.
+    """
+    root_prefix = os.path.join(os.fspath(root), "")
+    path_str = os.fspath(file_path)
+    if path_str.startswith(root_prefix):
+        return path_str[len(root_prefix):].replace(os.sep, "/")
+    return os.path.basename(path_str)
 
 
 def history_file_path(destination: Path) -> Path:
     return destination / ".history" / "sync_history.json"
 
 
+def history_journal_path(history_path: Path) -> Path:
+    """히스토리 스냅샷 옆에 두는 append-only 저널 경로 (sync_history.jsonl)."""
+    return history_path.with_suffix(".jsonl")
+
+
 def load_sync_history(history_path: Path) -> Dict[str, str]:
-    if not history_path.exists():
-        return {}
+    """스냅샷을 읽은 뒤 저널을 순서대로 재생한다 (마지막 기록 우선, t=null은 삭제)."""
+    history: Dict[str, str] = {}
+    if history_path.exists():
+        try:
+            with history_path.open("r", encoding="utf-8") as fp:
+                data = json.load(fp)
+            if isinstance(data, dict):
+                history = {str(key): str(value) for key, value in data.items()}
+        except Exception:
+            logging.exception("Failed to load sync history: %s", history_path)
+
+    journal_path = history_journal_path(history_path)
+    if not journal_path.exists():
+        return history
+    try:
+        with journal_path.open("r", encoding="utf-8") as fp:
+            for line in fp:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # 비정상 종료로 마지막 줄이 잘린 경우 등은 건너뛴다.
+                    continue
+                if not isinstance(record, dict) or record.get("k") is None:
+                    continue
+                key = str(record["k"])
+                value = record.get("t")
+                if value is None:
+                    history.pop(key, None)
+                else:
+                    history[key] = str(value)
+    except Exception:
+        logging.exception("Failed to replay sync history journal: %s", journal_path)
+    return history
+
+
+def append_sync_history(
+    history_path: Path,
+    entries: Iterable[tuple[str, Optional[str]]],
+) -> int:
+    """변경분을 저널에 한 줄씩 추가하고 기록한 줄 수를 반환 (값이 None이면 삭제 표시)."""
+    lines = [
+        json.dumps({"k": key, "t": value}, ensure_ascii=False) + "\n"
+        for key, value in entries
+    ]
+    if not lines:
+        return 0
+    journal_path = history_journal_path(history_path)
     try:
-        with history_path.open("r", encoding="utf-8") as fp:
-            data = json.load(fp)
-        if isinstance(data, dict):
-            return {str(key): str(value) for key, value in data.items()}
+        try:
+            fp = journal_path.open("a", encoding="utf-8")
+        except FileNotFoundError:
+            # .history 폴더가 외부에서 지워진 경우에만 다시 만든다.
+            journal_path.parent.mkdir(parents=True, exist_ok=True)
+            fp = journal_path.open("a", encoding="utf-8")
+        with fp:
+            fp.writelines(lines)
     except Exception:
-        logging.exception("Failed to load sync history: %s", history_path)
-    return {}
+        logging.exception("Failed to append sync history journal: %s", journal_path)
+        return 0
+    return len(lines)
 
 
 def save_sync_history(history_path: Path, history: Dict[str, str]) -> None:
+    """전체 히스토리를 임시 파일에 쓴 뒤 원자적으로 교체하고 저널을 비운다.
+
+    공백 없는 JSON을 한 번의 write로 기록하고 fsync한 다음 os.replace한다.
+    .history 폴더는 호출 측(FileSyncManager 시작 시)에서 미리 만들어 둔다.
+    """
     try:
-        history_path.parent.mkdir(parents=True, exist_ok=True)
-        with history_path.open("w", encoding="utf-8") as fp:
-            json.dump(history, fp, indent=2, ensure_ascii=False)
+        payload = json.dumps(history, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        temp_path = history_path.with_name(history_path.name + ".tmp")
+        try:
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        except FileNotFoundError:
+            history_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        with open(fd, "wb", buffering=0) as fp:
+            view = memoryview(payload)
+            while view:
+                view = view[fp.write(view):]
+            os.fsync(fp.fileno())
+        os.replace(temp_path, history_path)
+        history_journal_path(history_path).unlink(missing_ok=True)
     except Exception:
         logging.exception("Failed to persist sync history: %s", history_path)
-
-
@@ -2,6 +2,7 @@ import signal
 import sys
 import os
 import logging
+from datetime import datetime
 from pathlib import Path
 from app import create_app, socketio
 
@@ -18,7 +19,7 @@ def _configure_logging():
             # run.py가 있는 위치(프로젝트 루트)의 logs 폴더 사용
             default_dir = Path(__file__).resolve().parent / 'logs'
             default_dir.mkdir(parents=True, exist_ok=True)
-            ts = __import__('datetime').datetime.now().strftime('%Y%m%d_%H%M%S')
+            ts = datetime.now().strftime('%Y%m%d_%H%M%S')
             log_file = str(default_dir / f'filesync_{ts}.log')
         except Exception:
             log_file = None